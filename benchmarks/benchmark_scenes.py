@@ -0,0 +1,103 @@
+"""
+Representative workloads for run_benchmarks.py.  Each scene builds its
+mobjects in setup, whose time is reported as construction time, and then
+plays a canonical animation over them in construct, whose frames are timed
+by stage.  These are ordinary scenes, so any of them can also be rendered
+directly, e.g. with `manimgl benchmarks/benchmark_scenes.py SurfaceBenchmark`
+"""
+from manimlib import *
+
+
+class TexBenchmark(Scene):
+    def setup(self):
+        self.tex = Tex(R"""
+            \sum_{n=1}^\infty \frac{1}{n^2} = \frac{\pi^2}{6}
+            \quad
+            \int_{-\infty}^\infty e^{-x^2} \, dx = \sqrt{\pi}
+            \quad
+            \zeta(s) = \prod_{p \text{ prime}} \frac{1}{1 - p^{-s}}
+            \quad
+            e^{i \theta} = \cos(\theta) + i \sin(\theta)
+            \quad
+            \left( \sum_{k=1}^n a_k b_k \right)^2
+            \le \left( \sum_{k=1}^n a_k^2 \right) \left( \sum_{k=1}^n b_k^2 \right)
+        """)
+        self.tex.set_width(FRAME_WIDTH - 1)
+        self.add(self.tex)
+
+    def construct(self):
+        self.play(Write(self.tex), run_time=1)
+
+
+class SurfaceBenchmark(Scene):
+    def setup(self):
+        self.frame.reorient(-30, 70)
+        self.surface = ParametricSurface(
+            lambda u, v: [u, v, 0.5 * np.sin(u) * np.cos(v)],
+            u_range=(-3, 3),
+            v_range=(-3, 3),
+            resolution=(101, 101),
+            color=BLUE_D,
+        )
+        self.add(self.surface)
+
+    def construct(self):
+        self.play(Rotate(self.surface, PI / 2, axis=OUT), run_time=1)
+
+
+class StreamLinesBenchmark(Scene):
+    def setup(self):
+        plane = NumberPlane()
+
+        def func(coords):
+            x, y = np.transpose(coords)
+            return np.transpose([np.sin(y), np.cos(x)])
+
+        self.stream_lines = AnimatedStreamLines(StreamLines(func, plane))
+        self.add(plane, self.stream_lines)
+
+    def construct(self):
+        self.wait(1)
+
+
+class NonlinearTransformBenchmark(Scene):
+    def setup(self):
+        self.plane = NumberPlane()
+        self.plane.prepare_for_nonlinear_transform()
+        self.add(self.plane)
+
+    def construct(self):
+        self.play(ApplyComplexFunction(np.exp, self.plane), run_time=1)
+
+
+class DotCloudBenchmark(Scene):
+    random_seed = 0
+
+    def setup(self):
+        points = np.random.uniform(-1, 1, (10_000, 3)) * [FRAME_X_RADIUS, FRAME_Y_RADIUS, 1]
+        self.cloud = DotCloud(points, radius=0.02)
+        self.cloud.set_color_by_gradient(BLUE, YELLOW)
+        self.add(self.cloud)
+
+    def construct(self):
+        self.play(Rotate(self.cloud, PI, axis=UP), run_time=1)
+
+
+class TransformMatchingStringsBenchmark(Scene):
+    def setup(self):
+        self.source = Tex(R"a^2 + b^2 + 2ab = (a + b)^2 - c^2 + \frac{x}{y} + \sqrt{z}")
+        self.target = Tex(R"(a + b)^2 - c^2 + \sqrt{z} = a^2 + 2ab + b^2 + \frac{x}{y}")
+        self.add(self.source)
+
+    def construct(self):
+        self.play(TransformMatchingStrings(self.source, self.target), run_time=1)
+
+
+BENCHMARK_SCENES = [
+    TexBenchmark,
+    SurfaceBenchmark,
+    StreamLinesBenchmark,
+    NonlinearTransformBenchmark,
+    DotCloudBenchmark,
+    TransformMatchingStringsBenchmark,
+]
@@ -0,0 +1,309 @@
+#!/usr/bin/env python
+"""
+Checks that changes to the rendering pipeline leave its output alone.
+
+Renders scenes without a window, on the camera's standalone context, and
+reads back selected frames with Camera.get_raw_fbo_data: every nth frame of
+each play or wait call, along with the final frame of each.  "record" stores
+an exact hash, a perceptual hash and the pixels of each of those frames as
+the golden frames, and "check" renders them again and reports every frame
+which deviates from its golden version beyond a tolerance, with the play it
+belongs to and how much of it differs, exiting with an error if any do, or
+if any scene fails to render.  Scenes needing a program which isn't
+installed, such as LaTeX, are skipped.
+
+    python benchmarks/golden_frames.py record
+    python benchmarks/golden_frames.py check
+    python benchmarks/golden_frames.py check --file example_scenes.py UpdatersExample
+
+By default the scenes are those of benchmark_scenes.py.  Since output can
+vary slightly between GPUs and drivers, golden frames are meant to be
+recorded and checked on the same machine, and are kept out of version control.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import traceback
+
+import numpy as np
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_GOLDEN_DIR = os.path.join(BENCHMARK_DIR, "golden_frames")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "mode",
+        choices=["record", "check"],
+    )
+    parser.add_argument(
+        "scene_names",
+        nargs="*",
+        help="Names of scenes to render, by default all of those in the file",
+    )
+    parser.add_argument(
+        "--file",
+        default=os.path.join(BENCHMARK_DIR, "benchmark_scenes.py"),
+        help="Python file holding the scenes",
+    )
+    parser.add_argument(
+        "-r", "--resolution",
+        default="640x360",
+        help="Resolution to render at, passed as \"WxH\"",
+    )
+    parser.add_argument(
+        "--every",
+        type=int,
+        default=10,
+        help="Keep every nth frame of each play, in addition to its last frame",
+    )
+    parser.add_argument(
+        "--golden_dir",
+        default=DEFAULT_GOLDEN_DIR,
+        help="Directory holding golden frames",
+    )
+    parser.add_argument(
+        "--hashes_only",
+        action="store_true",
+        help="When recording, store only hashes rather than pixels, in which " + \
+             "case checks rely on the perceptual hash for tolerance",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=int,
+        default=0,
+        help="Largest difference in any pixel channel, out of 255, which still counts as a match",
+    )
+    parser.add_argument(
+        "--max_hash_distance",
+        type=int,
+        default=0,
+        help="Number of bits in which perceptual hashes may differ and still count " + \
+             "as a match, used when golden pixels weren't stored",
+    )
+    return parser.parse_args()
+
+
+def get_exact_hash(raw_bytes: bytes) -> str:
+    return hashlib.sha256(raw_bytes).hexdigest()
+
+
+def get_perceptual_hash(pixels: np.ndarray) -> str:
+    """
+    Difference hash of an rgba image: the image is reduced to 8 rows by
+    9 columns of average brightness, and each bit says whether a cell is
+    brighter than its neighbor to the left.  Small changes to an image
+    change few, if any, of these 64 bits.
+    """
+    gray = pixels[:, :, :3].astype(np.float64) @ [0.299, 0.587, 0.114]
+    height, width = gray.shape
+    row_starts = np.linspace(0, height, 9).astype(int)[:-1]
+    col_starts = np.linspace(0, width, 10).astype(int)[:-1]
+    sums = np.add.reduceat(np.add.reduceat(gray, row_starts, axis=0), col_starts, axis=1)
+    counts = np.outer(np.diff([*row_starts, height]), np.diff([*col_starts, width]))
+    cells = sums / counts
+    bits = (cells[:, 1:] > cells[:, :-1]).flatten()
+    return f"{int(''.join('1' if bit else '0' for bit in bits), 2):016x}"
+
+
+def get_hash_distance(hash1: str, hash2: str) -> int:
+    return bin(int(hash1, 16) ^ int(hash2, 16)).count("1")
+
+
+def get_recording_scene_class(scene_class, every: int, frames: dict[str, np.ndarray]):
+    """
+    Returns a subclass of scene_class which reads back the selected frames
+    into frames, keyed by the index of the play they're in and their index
+    within that play
+    """
+    class RecordingScene(scene_class):
+        def pre_play(self, *play_inputs):
+            super().pre_play(*play_inputs)
+            self.frame_in_play = 0
+
+        def emit_frame(self) -> None:
+            super().emit_frame()
+            if not self.skip_animations and self.frame_in_play % every == 0:
+                self.record_frame(str(self.frame_in_play))
+            self.frame_in_play += 1
+
+        def post_play(self):
+            if not self.skip_animations:
+                self.record_frame("end")
+            super().post_play()
+
+        def record_frame(self, label: str) -> None:
+            width, height = self.camera.fbo.size
+            pixels = np.frombuffer(self.camera.get_raw_fbo_data(), dtype=np.uint8)
+            frames[f"{self.num_plays}:{label}"] = pixels.reshape((height, width, 4))
+
+    RecordingScene.__name__ = scene_class.__name__
+    return RecordingScene
+
+
+def render_frames(scene_class, resolution: tuple[int, int], every: int) -> dict[str, np.ndarray]:
+    frames = dict()
+    with tempfile.TemporaryDirectory() as output_directory:
+        scene = get_recording_scene_class(scene_class, every, frames)(
+            camera_config=dict(resolution=resolution),
+            file_writer_config=dict(
+                write_to_movie=False,
+                save_last_frame=False,
+                output_directory=output_directory,
+                open_file_upon_completion=False,
+                show_file_location_upon_completion=False,
+                quiet=True,
+            ),
+        )
+        scene.run()
+    return frames
+
+
+def summarize_frames(frames: dict[str, np.ndarray]) -> dict[str, dict[str, str]]:
+    return {
+        key: dict(
+            exact=get_exact_hash(pixels.tobytes()),
+            perceptual=get_perceptual_hash(pixels),
+        )
+        for key, pixels in frames.items()
+    }
+
+
+def record(scene_class, args: argparse.Namespace, resolution: tuple[int, int]) -> None:
+    frames = render_frames(scene_class, resolution, args.every)
+    name = scene_class.__name__
+    os.makedirs(args.golden_dir, exist_ok=True)
+    with open(os.path.join(args.golden_dir, f"{name}.json"), "w") as fp:
+        json.dump(dict(
+            resolution=args.resolution,
+            every=args.every,
+            frames=summarize_frames(frames),
+        ), fp, indent=2)
+    pixels_path = os.path.join(args.golden_dir, f"{name}.npz")
+    if args.hashes_only:
+        if os.path.exists(pixels_path):
+            os.remove(pixels_path)
+    else:
+        np.savez_compressed(pixels_path, **{key.replace(":", "_"): value for key, value in frames.items()})
+    print(f"Recorded {len(frames)} frames of {name}")
+
+
+def compare_frame(
+    key: str,
+    pixels: np.ndarray,
+    golden: dict[str, str],
+    golden_pixels: np.ndarray | None,
+    args: argparse.Namespace,
+) -> str | None:
+    """
+    Returns a description of how the frame deviates from its golden
+    version, or None if it matches within tolerance
+    """
+    summary = summarize_frames({key: pixels})[key]
+    if summary["exact"] == golden["exact"]:
+        return None
+    play, label = key.split(":")
+    where = f"play {play}, " + ("last frame" if label == "end" else f"frame {label}")
+    distance = get_hash_distance(summary["perceptual"], golden["perceptual"])
+
+    if golden_pixels is None:
+        if distance <= args.max_hash_distance:
+            return None
+        return f"{where}: perceptual hash differs in {distance} of 64 bits"
+
+    if golden_pixels.shape != pixels.shape:
+        return f"{where}: frame shape {pixels.shape} differs from golden {golden_pixels.shape}"
+    diff = np.abs(pixels.astype(np.int16) - golden_pixels).max(axis=2)
+    max_diff = int(diff.max())
+    if max_diff <= args.tolerance:
+        return None
+    n_over = int((diff > args.tolerance).sum())
+    ys, xs = np.nonzero(diff > args.tolerance)
+    height = diff.shape[0]
+    # Rows of frame buffer data run from the bottom of the image up
+    box = tuple(map(int, (xs.min(), height - 1 - ys.max(), xs.max(), height - 1 - ys.min())))
+    return "{}: {} pixels ({:.3%}) differ by up to {}, within x, y from {} to {}, perceptual distance {}".format(
+        where, n_over, n_over / diff.size, max_diff, box[:2], box[2:], distance,
+    )
+
+
+def check(scene_class, args: argparse.Namespace, resolution: tuple[int, int]) -> list[str]:
+    name = scene_class.__name__
+    summary_path = os.path.join(args.golden_dir, f"{name}.json")
+    if not os.path.exists(summary_path):
+        return [f"No golden frames recorded for {name}"]
+    with open(summary_path) as fp:
+        golden = json.load(fp)
+    if golden["resolution"] != args.resolution or golden["every"] != args.every:
+        return [f"Golden frames for {name} were recorded at {golden['resolution']}, every {golden['every']} frames"]
+
+    pixels_path = os.path.join(args.golden_dir, f"{name}.npz")
+    golden_pixels = np.load(pixels_path) if os.path.exists(pixels_path) else None
+
+    frames = render_frames(scene_class, resolution, args.every)
+    failures = []
+    for key in sorted(set(frames).symmetric_difference(golden["frames"])):
+        failures.append(f"frame {key} is " + ("new" if key in frames else "missing"))
+    for key, pixels in frames.items():
+        if key not in golden["frames"]:
+            continue
+        failure = compare_frame(
+            key, pixels, golden["frames"][key],
+            None if golden_pixels is None else golden_pixels[key.replace(":", "_")],
+            args,
+        )
+        if failure is not None:
+            failures.append(failure)
+    print(f"{name}: {len(frames)} frames checked, {len(failures)} deviations")
+    return [f"{name} {failure}" for failure in failures]
+
+
+def main() -> None:
+    args = parse_args()
+    # Importing manimlib parses the command line for its own configuration
+    sys.argv = sys.argv[:1]
+    from manimlib.extract_scene import get_scene_classes
+    from manimlib.module_loader import ModuleLoader
+
+    module = ModuleLoader.get_module(os.path.abspath(args.file))
+    scene_classes = get_scene_classes(module)
+    if args.scene_names:
+        name_to_class = {sc.__name__: sc for sc in scene_classes}
+        unknown = [name for name in args.scene_names if name not in name_to_class]
+        if unknown:
+            raise SystemExit(f"Unknown scenes: {', '.join(unknown)}")
+        scene_classes = [name_to_class[name] for name in args.scene_names]
+
+    resolution = tuple(map(int, args.resolution.split("x")))
+    failures = []
+    for scene_class in scene_classes:
+        try:
+            if args.mode == "record":
+                record(scene_class, args, resolution)
+            else:
+                failures.extend(check(scene_class, args, resolution))
+        except FileNotFoundError:
+            # Some scenes need tools, like LaTeX, which may not be installed
+            error = traceback.format_exc(limit=1).strip().split("\n")[-1]
+            print(f"Skipped {scene_class.__name__}: {error}")
+        except Exception:
+            error = traceback.format_exc(limit=1).strip().split("\n")[-1]
+            if args.mode == "record":
+                print(f"Could not record {scene_class.__name__}: {error}")
+            else:
+                failures.append(f"{scene_class.__name__} failed to render: {error}")
+
+    if failures:
+        print(f"{len(failures)} frames deviate from their golden versions, or scenes failed:")
+        print("\n".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+"""
+Renders small scenes for rendering bugs fixed in the past, and rebuilds
+mobjects for caching bugs, and checks that each is still fixed, exiting
+with an error if any is not.  Unlike golden_frames.py, these checks need
+nothing recorded beforehand.
+
+    python benchmarks/regressions.py
+"""
+from __future__ import annotations
+
+import sys
+import uuid
+
+import numpy as np
+
+from golden_frames import render_frames
+
+
+def get_regression_checks():
+    """
+    Returns pairs of a scene, and a function taking the frames rendered
+    from it, as given by render_frames, and returning a description of what
+    went wrong, or None if nothing did
+    """
+    from manimlib import BLUE
+    from manimlib import Circle
+    from manimlib import FadeIn
+    from manimlib import RIGHT
+    from manimlib import Scene
+    from manimlib import Square
+    from manimlib import VGroup
+
+    def check_first_play_moves(frames: dict[str, np.ndarray]) -> str | None:
+        if np.array_equal(frames["0:0"], frames["0:end"]):
+            return "the last frame of the first play is the same as its first frame"
+        return None
+
+    class FadeInNewMobject(Scene):
+        # Mobjects added to the scene by play are only put in a render group
+        # after their animation begins, which that group must still see
+        def construct(self):
+            self.play(FadeIn(Circle().set_fill(BLUE, 1)), run_time=0.3)
+
+    class FadeInNewGroup(Scene):
+        def construct(self):
+            squares = VGroup(*(Square(0.2).shift(0.25 * i * RIGHT) for i in range(100)))
+            self.play(FadeIn(squares.center()), run_time=0.3)
+
+    return [
+        (FadeInNewMobject, check_first_play_moves),
+        (FadeInNewGroup, check_first_play_moves),
+    ]
+
+
+def get_cache_checks():
+    """
+    Returns functions each returning a description of what went wrong with
+    a cache, or None if nothing did
+    """
+    from manimlib.mobject.svg.svg_mobject import SVG_HASH_TO_MOB_MAP
+    from manimlib.mobject.svg.svg_mobject import SVGMobject
+
+    def get_svg_string(elements: str) -> str:
+        # Unique, so that the first build misses the disk cache
+        return "\n".join([
+            '<svg xmlns="http://www.w3.org/2000/svg" width="200" height="200">',
+            f"<!-- {uuid.uuid4()} -->",
+            elements,
+            "</svg>",
+        ])
+
+    def check_warm_svg_matches_cold(svg_string: str) -> str | None:
+        cold = SVGMobject(svg_string=svg_string)
+        # Like a new process, which only has the disk cache
+        SVG_HASH_TO_MOB_MAP.clear()
+        warm = SVGMobject(svg_string=svg_string)
+        cold_types = [type(sm).__name__ for sm in cold.submobjects]
+        warm_types = [type(sm).__name__ for sm in warm.submobjects]
+        if warm_types != cold_types:
+            return f"submobjects built as {cold_types} are loaded from the cache as {warm_types}"
+        if not np.array_equal(warm.get_all_points(), cold.get_all_points()):
+            return "submobjects loaded from the cache have different points"
+        return None
+
+    def check_svg_shapes_cached():
+        return check_warm_svg_matches_cold(get_svg_string("""
+            <path d="M10 10 C 20 20, 40 20, 50 10 A 30 20 0 0 1 90 60 Z" fill="#ff0000"/>
+            <rect x="100" y="100" width="40" height="30" fill="#0000ff"/>
+            <rect x="150" y="100" width="40" height="30" rx="5" ry="5" fill="#00ff00"/>
+            <polygon points="0,200 50,150 100,200" fill="#00ffff"/>
+            <polyline points="0,0 50,50 100,0" stroke="#ffffff"/>
+        """))
+
+    def check_svg_uncacheable_shapes():
+        return check_warm_svg_matches_cold(get_svg_string("""
+            <path d="M 0 0 L 10 0 L 10 10 Z" fill="#ffffff"/>
+            <circle cx="150" cy="50" r="20" fill="#ffff00"/>
+            <line x1="0" y1="100" x2="200" y2="120" stroke="#ffffff"/>
+        """))
+
+    return [check_svg_shapes_cached, check_svg_uncacheable_shapes]
+
+
+def main() -> None:
+    # Importing manimlib parses the command line for its own configuration
+    sys.argv = sys.argv[:1]
+    failures = []
+    for scene_class, check in get_regression_checks():
+        frames = render_frames(scene_class, (320, 180), every=1)
+        failure = check(frames)
+        if failure is not None:
+            failures.append(f"{scene_class.__name__}: {failure}")
+        print(f"{scene_class.__name__}: {'failed' if failure else 'ok'}")
+    for check in get_cache_checks():
+        failure = check()
+        if failure is not None:
+            failures.append(f"{check.__name__}: {failure}")
+        print(f"{check.__name__}: {'failed' if failure else 'ok'}")
+
+    if failures:
+        print(f"{len(failures)} regressions:")
+        print("\n".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+"""
+Times the scenes in benchmark_scenes.py without a window, on a standalone
+OpenGL context, writing each to a throwaway movie file so that the full
+pipeline of updating, rendering, reading back and encoding frames is run.
+
+For each scene it reports the time spent in setup, where the mobjects are
+built, and the time per frame spent updating (updaters and animation
+interpolation), capturing, reading back and writing frames.  Results are
+printed, and can be written out as json, saved as a baseline, and compared
+against a saved baseline, e.g.
+
+    python benchmarks/run_benchmarks.py --save_baseline
+    python benchmarks/run_benchmarks.py --compare
+
+Timings only mean anything relative to the same machine, so the baseline,
+benchmarks/baseline.json by default, is kept out of version control.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import traceback
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Metrics reported for each scene, and the profiler categories summed into each
+PER_FRAME_METRICS = {
+    "update_ms": ("update_mobjects", "interpolate"),
+    "capture_ms": ("capture",),
+    "readback_ms": ("readback",),
+    "write_ms": ("write_frame",),
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "scene_names",
+        nargs="*",
+        help="Names of benchmark scenes to run, by default all of them",
+    )
+    parser.add_argument(
+        "-r", "--resolution",
+        default="1920x1080",
+        help="Resolution to render at, passed as \"WxH\"",
+    )
+    parser.add_argument(
+        "--fps",
+        type=int,
+        default=30,
+    )
+    parser.add_argument(
+        "-n", "--repeats",
+        type=int,
+        default=3,
+        help="Run each scene this many times, keeping the fastest time for each metric",
+    )
+    parser.add_argument(
+        "-o", "--output",
+        help="Path to write results to as json",
+    )
+    parser.add_argument(
+        "--baseline",
+        default=DEFAULT_BASELINE,
+        help="Path of the baseline results used by --save_baseline and --compare",
+    )
+    parser.add_argument(
+        "--save_baseline",
+        action="store_true",
+        help="Store these results as the baseline",
+    )
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="Compare against the baseline, exiting with an error on any regression",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Fraction by which a metric may exceed its baseline before counting as a regression",
+    )
+    parser.add_argument(
+        "--min_difference_ms",
+        type=float,
+        default=0.5,
+        help="Differences smaller than this many milliseconds never count as regressions",
+    )
+    return parser.parse_args()
+
+
+def get_timed_scene_class(scene_class):
+    """
+    Times all updating as a whole, rather than by updater, since some
+    mobjects, like AnimatedStreamLines, do their updating by overriding
+    Mobject.update
+    """
+    from manimlib.utils.cpu_profiling import cpu_section
+
+    def update_mobjects(self, dt: float) -> None:
+        with cpu_section("update_mobjects", "Scene.update_mobjects"):
+            scene_class.update_mobjects(self, dt)
+
+    return type(scene_class.__name__, (scene_class,), dict(update_mobjects=update_mobjects))
+
+
+def run_scene(scene_class, resolution: tuple[int, int], fps: int) -> dict[str, float]:
+    from manimlib.utils.cpu_profiling import CPUProfiler
+    from manimlib.utils.cpu_profiling import set_active_cpu_profiler
+
+    with tempfile.TemporaryDirectory() as output_directory:
+        scene = get_timed_scene_class(scene_class)(
+            camera_config=dict(
+                resolution=resolution,
+                fps=fps,
+                skip_repeated_frames=False,
+            ),
+            file_writer_config=dict(
+                write_to_movie=True,
+                save_last_frame=False,
+                subdivide_output=False,
+                cache_partial_movies=False,
+                output_directory=output_directory,
+                file_name=scene_class.__name__,
+                open_file_upon_completion=False,
+                show_file_location_upon_completion=False,
+                quiet=True,
+            ),
+        )
+        profiler = CPUProfiler()
+        set_active_cpu_profiler(profiler)
+        start = time.perf_counter()
+        try:
+            scene.run()
+        except Exception:
+            # Close the movie pipe before its directory goes away
+            scene.file_writer.ended_with_interrupt = True
+            scene.file_writer.finish()
+            raise
+        finally:
+            set_active_cpu_profiler(None)
+        total = time.perf_counter() - start
+
+    by_category: dict[str, list[int]] = dict()
+    for (index, category, name), (ns, count) in profiler.totals.items():
+        totals = by_category.setdefault(category, [0, 0])
+        totals[0] += ns
+        totals[1] += count
+    n_frames = by_category.get("write_frame", [0, 0])[1]
+
+    result = dict(
+        setup_ms=by_category.get("setup", [0, 0])[0] / 1e6,
+        n_frames=n_frames,
+        total_ms=1000 * total,
+    )
+    for metric, categories in PER_FRAME_METRICS.items():
+        ns = sum(by_category.get(category, [0, 0])[0] for category in categories)
+        result[metric] = ns / 1e6 / max(n_frames, 1)
+    return result
+
+
+def run_benchmarks(scene_classes, args: argparse.Namespace) -> dict:
+    resolution = tuple(map(int, args.resolution.split("x")))
+    results = dict()
+    for scene_class in scene_classes:
+        name = scene_class.__name__
+        print(f"Running {name}", file=sys.stderr)
+        try:
+            runs = [run_scene(scene_class, resolution, args.fps) for n in range(args.repeats)]
+        except Exception:
+            # Some workloads need tools, like LaTeX, which may not be installed
+            results[name] = dict(error=traceback.format_exc(limit=1).strip().split("\n")[-1])
+            continue
+        results[name] = {
+            key: min(run[key] for run in runs)
+            for key in runs[0]
+        }
+    return dict(
+        machine=dict(
+            platform=platform.platform(),
+            processor=platform.processor(),
+            python=platform.python_version(),
+        ),
+        settings=dict(resolution=args.resolution, fps=args.fps, repeats=args.repeats),
+        results=results,
+    )
+
+
+def format_results(results: dict) -> str:
+    metrics = ["setup_ms", *PER_FRAME_METRICS, "n_frames", "total_ms"]
+    lines = [f"{'scene':<36}" + "".join(f"{metric:>13}" for metric in metrics)]
+    for name, result in results["results"].items():
+        if "error" in result:
+            lines.append(f"{name:<36} {result['error']}")
+            continue
+        lines.append(f"{name:<36}" + "".join(f"{result[metric]:>13.2f}" for metric in metrics))
+    return "\n".join(lines)
+
+
+def compare_results(results: dict, baseline: dict, tolerance: float, min_difference_ms: float) -> list[str]:
+    """
+    Returns a description of each metric which has grown past tolerance
+    since the baseline, printing how every shared metric compares
+    """
+    settings = results["settings"]
+    old_settings = baseline.get("settings", dict())
+    if any(old_settings.get(key) != settings[key] for key in ["resolution", "fps"]):
+        print(f"Warning: baseline was run with settings {old_settings}", file=sys.stderr)
+
+    regressions = []
+    metrics = ["setup_ms", *PER_FRAME_METRICS, "total_ms"]
+    for name, result in results["results"].items():
+        old_result = baseline["results"].get(name)
+        if old_result is None or "error" in result or "error" in old_result:
+            continue
+        for metric in metrics:
+            old, new = old_result[metric], result[metric]
+            ratio = new / old if old > 0 else 1.0
+            line = f"{name} {metric}: {old:.2f} -> {new:.2f} ({ratio:.2f}x)"
+            if ratio > 1 + tolerance and new - old > min_difference_ms:
+                regressions.append(line)
+                line += " REGRESSION"
+            print(line)
+    return regressions
+
+
+def main() -> None:
+    args = parse_args()
+    # Importing manimlib parses the command line for its own configuration
+    sys.argv = sys.argv[:1]
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from benchmark_scenes import BENCHMARK_SCENES
+
+    scene_classes = BENCHMARK_SCENES
+    if args.scene_names:
+        name_to_class = {sc.__name__: sc for sc in BENCHMARK_SCENES}
+        unknown = [name for name in args.scene_names if name not in name_to_class]
+        if unknown:
+            raise SystemExit(f"Unknown benchmark scenes: {', '.join(unknown)}")
+        scene_classes = [name_to_class[name] for name in args.scene_names]
+
+    results = run_benchmarks(scene_classes, args)
+    print(format_results(results))
+
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump(results, fp, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w") as fp:
+            json.dump(results, fp, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            raise SystemExit(f"No baseline at {args.baseline}, create one with --save_baseline")
+        with open(args.baseline) as fp:
+            baseline = json.load(fp)
+        regressions = compare_results(results, baseline, args.tolerance, args.min_difference_ms)
+        if regressions:
+            print(f"{len(regressions)} metrics regressed:")
+            print("\n".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
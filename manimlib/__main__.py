@@ -4,6 +4,7 @@ from addict import Dict
 from manimlib import __version__
 from manimlib.config import manim_config
 from manimlib.config import parse_cli
+from manimlib.logger import log
 import manimlib.extract_scene
 from manimlib.utils.cache import clear_cache
 from manimlib.window import Window
@@ -57,6 +58,13 @@ def main():
         return
     if args.clear_cache:
         clear_cache()
+    if args.warm_cache:
+        from manimlib.cache_warming import warm_cache
+        if args.file is None:
+            log.error("--warm-cache needs a file to read scenes from")
+            return
+        warm_cache(args.file)
+        return
 
     run_scenes()
 
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from copy import deepcopy
 
+import numpy as np
+
 from manimlib.mobject.mobject import _AnimationBuilder
 from manimlib.mobject.mobject import Mobject
 from manimlib.utils.iterables import remove_list_redundancies
+from manimlib.utils.rate_functions import rate_func_on_array
 from manimlib.utils.rate_functions import smooth
 from manimlib.utils.simple_functions import clip
 
@@ -14,10 +17,14 @@ if TYPE_CHECKING:
     from typing import Callable
 
     from manimlib.scene.scene import Scene
+    from manimlib.typing import FloatArray
 
 
 DEFAULT_ANIMATION_RUN_TIME = 1.0
 DEFAULT_ANIMATION_LAG_RATIO = 0
+# Below this many submobjects, the overhead of numpy outweighs
+# that of computing sub alphas one at a time
+MIN_VECTORIZED_SUB_ALPHAS = 32
 
 
 class Animation(object):
@@ -152,8 +159,16 @@ class Animation(object):
         return alpha
 
     def interpolate_mobject(self, alpha: float) -> None:
-        for i, mobs in enumerate(self.families):
-            sub_alpha = self.get_sub_alpha(self.time_spanned_alpha(alpha), i, len(self.families))
+        alpha = self.time_spanned_alpha(alpha)
+        n_families = len(self.families)
+        if n_families < MIN_VECTORIZED_SUB_ALPHAS:
+            for i, mobs in enumerate(self.families):
+                self.interpolate_submobject(*mobs, self.get_sub_alpha(alpha, i, n_families))
+            return
+        # Iterating over the array, rather than its tolist(), passes on
+        # np.float64 values, which like the float64 alphas a scene
+        # passes in keep interpolation of float32 data in float64
+        for mobs, sub_alpha in zip(self.families, self.get_sub_alphas(alpha, n_families)):
             self.interpolate_submobject(*mobs, sub_alpha)
 
     def interpolate_submobject(
@@ -181,6 +196,26 @@ class Animation(object):
         raw_sub_alpha = clip((value - lower), 0, 1)
         return self.rate_func(raw_sub_alpha)
 
+    def get_sub_alphas(
+        self,
+        alpha: float,
+        num_submobjects: int
+    ) -> FloatArray:
+        """
+        Returns get_sub_alpha(alpha, index, num_submobjects) for every
+        index, computed together rather than one call at a time
+        """
+        if num_submobjects < MIN_VECTORIZED_SUB_ALPHAS:
+            return np.array([
+                self.get_sub_alpha(alpha, index, num_submobjects)
+                for index in range(num_submobjects)
+            ], dtype=np.float64)
+        lag_ratio = self.lag_ratio
+        full_length = (num_submobjects - 1) * lag_ratio + 1
+        lowers = np.arange(num_submobjects) * lag_ratio
+        raw_sub_alphas = np.clip(alpha * full_length - lowers, 0, 1)
+        return rate_func_on_array(self.rate_func, raw_sub_alphas)
+
     # Getters and setters
     def set_run_time(self, run_time: float):
         self.run_time = run_time
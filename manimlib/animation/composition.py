@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import numpy as np
+
 from manimlib.animation.animation import Animation
 from manimlib.animation.animation import prepare_animation
 from manimlib.mobject.mobject import _AnimationBuilder
@@ -9,7 +11,6 @@ from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.utils.bezier import integer_interpolate
 from manimlib.utils.bezier import interpolate
 from manimlib.utils.iterables import remove_list_redundancies
-from manimlib.utils.simple_functions import clip
 
 from typing import TYPE_CHECKING, Union, Iterable
 AnimationType = Union[Animation, _AnimationBuilder]
@@ -104,6 +105,8 @@ class AnimationGroup(Animation):
             curr_time = interpolate(
                 start_time, end_time, lag_ratio
             )
+        self.anim_start_times = np.array([awt[1] for awt in self.anims_with_timings])
+        self.anim_durations = np.array([awt[2] - awt[1] for awt in self.anims_with_timings])
 
     def interpolate(self, alpha: float) -> None:
         # Note, if the run_time of AnimationGroup has been
@@ -112,14 +115,22 @@ class AnimationGroup(Animation):
         # e.g. of the surrounding scene.  Instead they'd
         # be a rescaled version.  But that's okay!
         time = alpha * self.max_end_time
-        for anim, start_time, end_time in self.anims_with_timings:
-            anim_time = end_time - start_time
-            if anim_time == 0:
-                sub_alpha = 0
-            else:
-                sub_alpha = clip((time - start_time) / anim_time, 0, 1)
+        for anim, sub_alpha in zip(self.animations, self.get_anim_sub_alphas(time)):
             anim.interpolate(sub_alpha)
 
+    def get_anim_sub_alphas(self, time: float) -> list[float]:
+        """
+        Returns how far along each animation is at the given time,
+        with those taking no time at all treated as not yet begun
+        """
+        durations = self.anim_durations
+        is_instant = durations == 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sub_alphas = np.clip((time - self.anim_start_times) / durations, 0, 1)
+        sub_alphas[is_instant] = 0
+        # As np.float64 values, like the times a scene passes in
+        return list(sub_alphas)
+
 
 class Succession(AnimationGroup):
     def __init__(
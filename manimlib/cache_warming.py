@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import ast
+import inspect
+import operator
+import types
+
+import numpy as np
+
+import manimlib
+from manimlib.logger import log
+from manimlib.mobject.svg import old_tex_mobject
+from manimlib.mobject.svg.old_tex_mobject import SingleStringTex
+from manimlib.mobject.svg.string_mobject import StringMobject
+from manimlib.mobject.svg.tex_mobject import Tex
+from manimlib.utils.tex_file_writing import compile_latex_batch
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Type
+    from manimlib.mobject.mobject import Mobject
+
+    MobjectCall = tuple[Type[Mobject], tuple, dict[str, Any]]
+
+
+# Operators which an argument may use for its value to be known without
+# running the scene, along with literals, containers and names of values
+# such as colors, e.g. Tex(R"\pi", t2c={R"\pi": BLUE}, font_size=2 * 24)
+STATIC_UNARY_OPERATORS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+STATIC_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+}
+# Types which names may refer to, such as the hex strings of colors
+STATIC_VALUE_TYPES = (str, bytes, bool, int, float, complex, type(None), np.ndarray, np.generic)
+
+
+def get_string_mobject_classes(namespace: dict[str, Any]) -> dict[str, Type[Mobject]]:
+    """
+    Returns the classes in namespace whose construction renders LaTeX or
+    text, such as Tex, TexText, Title, Text, MarkupText, Code and OldTex
+    """
+    return {
+        name: obj
+        for name, obj in namespace.items()
+        if inspect.isclass(obj) and issubclass(obj, (StringMobject, SingleStringTex))
+    }
+
+
+def get_static_value(node: ast.expr, namespace: dict[str, Any]) -> Any:
+    """
+    Computes the value of node, so long as it's made only of literals,
+    containers, simple arithmetic and names of plain values, like colors,
+    from namespace or from modules in it, and otherwise raises ValueError.
+    Nothing is called or evaluated along the way.
+    """
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, (ast.Name, ast.Attribute)):
+        value = look_up_name(node, namespace)
+        if not isinstance(value, STATIC_VALUE_TYPES):
+            raise ValueError(f"{ast.unparse(node)} is not a plain value")
+        return value
+    if isinstance(node, (ast.Tuple, ast.List, ast.Set)):
+        elements = [get_static_value(elt, namespace) for elt in node.elts]
+        return {ast.Tuple: tuple, ast.List: list, ast.Set: set}[type(node)](elements)
+    if isinstance(node, ast.Dict):
+        if any(key is None for key in node.keys):
+            raise ValueError("Values unpacked with ** aren't static")
+        return {
+            get_static_value(key, namespace): get_static_value(value, namespace)
+            for key, value in zip(node.keys, node.values)
+        }
+    if isinstance(node, ast.UnaryOp) and type(node.op) in STATIC_UNARY_OPERATORS:
+        func = STATIC_UNARY_OPERATORS[type(node.op)]
+        args = [get_static_value(node.operand, namespace)]
+    elif isinstance(node, ast.BinOp) and type(node.op) in STATIC_BINARY_OPERATORS:
+        func = STATIC_BINARY_OPERATORS[type(node.op)]
+        args = [get_static_value(node.left, namespace), get_static_value(node.right, namespace)]
+    else:
+        raise ValueError(f"{type(node).__name__} is not static")
+    try:
+        return func(*args)
+    except (ArithmeticError, TypeError) as error:
+        raise ValueError(str(error))
+
+
+def look_up_name(node: ast.Name | ast.Attribute, namespace: dict[str, Any]) -> Any:
+    """
+    Finds the object a name, or a chain of attributes of modules, such as
+    np.pi, refers to, refusing attributes starting with an underscore
+    """
+    if isinstance(node, ast.Name):
+        if node.id not in namespace:
+            raise ValueError(f"{node.id} is not defined")
+        return namespace[node.id]
+    if not isinstance(node.value, (ast.Name, ast.Attribute)):
+        raise ValueError(f"{ast.unparse(node)} is not static")
+    if node.attr.startswith("_"):
+        raise ValueError(f"{node.attr} is private")
+    module = look_up_name(node.value, namespace)
+    if not isinstance(module, types.ModuleType):
+        raise ValueError(f"Only attributes of modules are static, not those of {ast.unparse(node.value)}")
+    if not hasattr(module, node.attr):
+        raise ValueError(f"{ast.unparse(node)} is not defined")
+    return getattr(module, node.attr)
+
+
+def find_string_mobject_calls(source: str, namespace: dict[str, Any]) -> list[MobjectCall]:
+    """
+    Finds each call within source which constructs one of the string
+    mobject classes of namespace with arguments known ahead of time, that
+    is with string literals for positional arguments, and static values
+    for any keyword arguments
+    """
+    classes = get_string_mobject_classes(namespace)
+    result = []
+    for node in ast.walk(ast.parse(source)):
+        if not isinstance(node, ast.Call):
+            continue
+        if isinstance(node.func, ast.Name):
+            name = node.func.id
+        elif isinstance(node.func, ast.Attribute):
+            name = node.func.attr
+        else:
+            continue
+        if name not in classes:
+            continue
+        if any(keyword.arg is None for keyword in node.keywords):
+            # Values passed with ** aren't known
+            continue
+        try:
+            args = tuple(get_static_value(arg, namespace) for arg in node.args)
+            if not args or not all(isinstance(arg, str) for arg in args):
+                continue
+            kwargs = {
+                keyword.arg: get_static_value(keyword.value, namespace)
+                for keyword in node.keywords
+            }
+        except ValueError:
+            continue
+        result.append((classes[name], args, kwargs))
+    return result
+
+
+def warm_cache(file_name: str) -> None:
+    """
+    Renders the LaTeX and text of each Tex, Text, etc. in the given scene
+    file, whose arguments can be read without running it, into the cache,
+    so that later renders of its scenes don't wait on them.  The LaTeX of
+    Tex and TexText is compiled without building them, in batches, see
+    compile_latex_batch, and so in parallel.
+    """
+    with open(file_name, encoding="utf-8") as fp:
+        source = fp.read()
+    # Scenes using OldTex import it on their own
+    namespace = {**vars(old_tex_mobject), **vars(manimlib)}
+    calls = find_string_mobject_calls(source, namespace)
+
+    # Remove duplicates, keeping order
+    unique_calls = dict()
+    for call in calls:
+        unique_calls.setdefault(repr(call), call)
+    calls = list(unique_calls.values())
+    log.info(f"Warming the cache with {len(calls)} Tex and Text mobjects from {file_name}")
+
+    n_failed = 0
+
+    def build(call: MobjectCall) -> None:
+        nonlocal n_failed
+        mob_class, args, kwargs = call
+        try:
+            mob_class(*args, **kwargs)
+        except Exception as error:
+            n_failed += 1
+            log.warning(f"Could not build {mob_class.__name__}{args}: {error}")
+
+    latex_items = []
+    other_calls = []
+    for call in calls:
+        mob_class, args, kwargs = call
+        if not issubclass(mob_class, Tex) or mob_class.__init__ is not Tex.__init__:
+            other_calls.append(call)
+            continue
+        try:
+            latex_items.extend(mob_class.get_latex_items(*args, **kwargs))
+        except Exception as error:
+            n_failed += 1
+            log.warning(f"Could not parse {mob_class.__name__}{args}: {error}")
+    try:
+        compile_latex_batch(latex_items)
+    except Exception as error:
+        # Whatever else compiled is still cached
+        n_failed += 1
+        log.warning(f"Could not compile LaTeX: {error}")
+    for call in other_calls:
+        build(call)
+
+    log.info(f"Cache warmed, with {n_failed} failures")
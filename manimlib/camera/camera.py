@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections import deque
+
 import moderngl
 import numpy as np
 import OpenGL.GL as gl
@@ -10,14 +12,19 @@ from manimlib.constants import BLACK
 from manimlib.constants import DEFAULT_RESOLUTION
 from manimlib.constants import FRAME_HEIGHT
 from manimlib.constants import FRAME_WIDTH
+from manimlib.logger import log
 from manimlib.mobject.mobject import Mobject
 from manimlib.mobject.mobject import Point
 from manimlib.utils.color import color_to_rgba
+from manimlib.utils.gpu_profiling import gpu_stage
+from manimlib.utils.gpu_profiling import set_gpu_stage_label
+from manimlib.utils.shaders import CAMERA_UNIFORM_BINDING
+from manimlib.utils.shaders import get_uniforms_key
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Optional
+    from typing import Optional, Sequence
     from manimlib.typing import ManimColor, Vect3
     from manimlib.window import Window
 
@@ -44,6 +51,25 @@ class Camera(object):
         # without multisampling, for 3d scenes one might want
         # to set samples to be greater than 0.
         samples: int = 0,
+        # When set to "async", frames written to file are read back through
+        # a ring of pixel-pack buffers, so that fetching the pixels of one
+        # frame overlaps with rendering the next. Use "sync" to read each
+        # frame back immediately.
+        readback_mode: str = "sync",
+        n_readback_buffers: int = 2,
+        # Pixel layout of frames read back for movie files. With "yuv420p",
+        # a final shader pass flips the frame and converts it to planar
+        # YUV 4:2:0, which cuts the bytes read back per frame from 4 per
+        # pixel to 1.5, and spares the encoder that work.
+        readback_pixel_format: str = "rgba",
+        # When true, the run of unchanging mobjects at the bottom of the
+        # z-order is rendered once into an offscreen buffer, which is then
+        # copied in at the start of each frame until any of them change.
+        cache_static_layers: bool = False,
+        # When true, a frame in which nothing is animating or updating, and
+        # which matches the last one drawn in every input to rendering, is
+        # neither drawn nor read back again, the last pixels are reused.
+        skip_repeated_frames: bool = True,
     ):
         self.window = window
         self.background_image = background_image
@@ -55,15 +81,25 @@ class Camera(object):
         self.pixel_array_dtype = pixel_array_dtype
         self.light_source_position = light_source_position
         self.samples = samples
+        self.readback_mode = readback_mode
+        self.n_readback_buffers = n_readback_buffers
+        self.readback_pixel_format = readback_pixel_format
+        self.cache_static_layers = cache_static_layers
+        self.skip_repeated_frames = skip_repeated_frames
 
         self.rgb_max_val: float = np.iinfo(self.pixel_array_dtype).max
         self.background_rgba: list[float] = list(color_to_rgba(
             background_color, background_opacity
         ))
+        # Any uniforms here are set on each program individually, whereas
+        # the view, frame and lighting state go through the uniform buffer
         self.uniforms = dict()
         self.init_frame(**frame_config)
         self.init_context()
         self.init_fbo()
+        self.init_uniform_buffer()
+        self.init_readback_buffers()
+        self.init_static_layer()
         self.init_light_source()
 
     def init_frame(self, **config) -> None:
@@ -94,6 +130,113 @@ class Camera(object):
 
         self.fbo.use()
 
+    def init_readback_buffers(self) -> None:
+        if self.readback_mode not in ("sync", "async"):
+            raise ValueError(f"Unrecognized readback_mode: {self.readback_mode}")
+        if self.readback_pixel_format not in ("rgba", "yuv420p"):
+            raise ValueError(f"Unrecognized readback_pixel_format: {self.readback_pixel_format}")
+        if self.readback_pixel_format == "yuv420p":
+            width, height = self.default_pixel_shape
+            if width % 2 or height % 2:
+                log.warning("yuv420p readback requires even pixel dimensions, falling back to rgba")
+                self.readback_pixel_format = "rgba"
+            else:
+                self.init_yuv_pass()
+        # Pixel-pack buffers are only allocated on first use
+        self.readback_buffers: list[moderngl.Buffer] = []
+        self.pending_readbacks: deque[moderngl.Buffer] = deque()
+        # Key of the frame last drawn, see get_frame_key, and counts of the
+        # frames drawn so far and of the frame last read back, whose pixels
+        # are kept for when it's captured again
+        self.frame_key: Optional[tuple] = None
+        self.n_frames_drawn: int = 0
+        self.readback_frame_number: int = -1
+        self.last_raw_frame: Optional[bytes] = None
+
+    def init_yuv_pass(self) -> None:
+        """
+        Prepares a pass which reads the draw_fbo texture and writes the
+        flipped frame, in planar YUV 4:2:0 (BT.601, limited range), to a
+        single channel texture. Its width matches that of the frame and
+        its height is 3/2 that of the frame, so that its bytes, read from
+        the bottom row up, are laid out as the Y, U and V planes in order.
+        """
+        width, height = self.default_pixel_shape
+        self.yuv_fbo = self.ctx.framebuffer(
+            color_attachments=self.ctx.texture((width, 3 * height // 2), components=1)
+        )
+        yuv_program = self.ctx.program(
+            vertex_shader='''
+                #version 330
+
+                in vec2 texcoord;
+
+                void main() {
+                    gl_Position = vec4((2.0 * texcoord - 1.0), 0.0, 1.0);
+                }
+            ''',
+            fragment_shader='''
+                #version 330
+
+                uniform sampler2D Texture;
+                uniform ivec2 frame_size;
+
+                out vec4 frag_color;
+
+                vec3 rgb_at(ivec2 coords){
+                    // Coords are measured from the top of the image,
+                    // while rows of the texture start from the bottom
+                    return texelFetch(Texture, ivec2(coords.x, frame_size.y - 1 - coords.y), 0).rgb;
+                }
+
+                void main() {
+                    int width = frame_size.x;
+                    int luma_size = width * frame_size.y;
+                    int chroma_size = luma_size / 4;
+                    int index = int(gl_FragCoord.y) * width + int(gl_FragCoord.x);
+                    float value;
+                    if(index < luma_size){
+                        vec3 rgb = rgb_at(ivec2(index % width, index / width));
+                        value = 16.0 + dot(rgb, vec3(65.481, 128.553, 24.966));
+                    }else{
+                        int chroma_index = index - luma_size;
+                        bool is_v = chroma_index >= chroma_size;
+                        if(is_v) chroma_index -= chroma_size;
+                        int half_width = width / 2;
+                        ivec2 corner = 2 * ivec2(chroma_index % half_width, chroma_index / half_width);
+                        vec3 rgb = 0.25 * (
+                            rgb_at(corner) + rgb_at(corner + ivec2(1, 0)) +
+                            rgb_at(corner + ivec2(0, 1)) + rgb_at(corner + ivec2(1, 1))
+                        );
+                        if(is_v){
+                            value = 128.0 + dot(rgb, vec3(112.0, -93.786, -18.214));
+                        }else{
+                            value = 128.0 + dot(rgb, vec3(-37.797, -74.203, 112.0));
+                        }
+                    }
+                    frag_color = vec4(value / 255.0, 0.0, 0.0, 1.0);
+                }
+            ''',
+        )
+        yuv_program["Texture"].value = 0
+        yuv_program["frame_size"].value = (width, height)
+        verts = np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
+        self.yuv_vao = self.ctx.simple_vertex_array(
+            yuv_program, self.ctx.buffer(verts.astype('f4').tobytes()), 'texcoord',
+            mode=moderngl.TRIANGLE_STRIP
+        )
+
+    def init_uniform_buffer(self) -> None:
+        # Laid out to match the std140 CameraUniforms block declared in
+        # shaders/inserts/camera_uniforms.glsl, with each vec3 followed
+        # by a float which fills out its padding
+        self.uniform_block_data = np.zeros(28, dtype=np.float32)
+        self.uniform_buffer = self.ctx.buffer(reserve=self.uniform_block_data.nbytes)
+
+    def init_static_layer(self) -> None:
+        self.static_layer_fbo: Optional[moderngl.Framebuffer] = None
+        self.static_layer_key: Optional[tuple] = None
+
     def init_light_source(self) -> None:
         self.light_source = Point(self.light_source_position)
 
@@ -146,6 +289,111 @@ class Camera(object):
             dtype=dtype,
         )
 
+    def uses_async_readback(self) -> bool:
+        return self.readback_mode == "async"
+
+    def get_readback_fbo(self) -> tuple[moderngl.Framebuffer, int]:
+        """
+        Prepares the frame buffer from which frames written to file are read,
+        returning it along with its number of components
+        """
+        self.blit(self.fbo, self.draw_fbo)
+        if self.readback_pixel_format == "yuv420p":
+            self.draw_fbo.color_attachments[0].use(0)
+            self.yuv_fbo.use()
+            self.ctx.disable(moderngl.BLEND)
+            self.yuv_vao.render()
+            self.ctx.enable(moderngl.BLEND)
+            self.fbo.use()
+            return self.yuv_fbo, 1
+        return self.draw_fbo, self.n_channels
+
+    def get_raw_frame_nbytes(self) -> int:
+        width, height = self.draw_fbo.size
+        if self.readback_pixel_format == "yuv420p":
+            return 3 * width * height // 2
+        return width * height * self.n_channels
+
+    def get_raw_frame_data(self) -> bytes:
+        """
+        Returns the current frame as written to movie files, laid out
+        according to readback_pixel_format
+        """
+        if self.is_frame_read_back() and self.last_raw_frame is not None:
+            return self.last_raw_frame
+        set_gpu_stage_label("Camera")
+        with gpu_stage("readback"):
+            fbo, components = self.get_readback_fbo()
+            data = fbo.read(viewport=fbo.viewport, components=components, dtype='f1')
+        self.readback_frame_number = self.n_frames_drawn
+        self.last_raw_frame = data
+        return data
+
+    def get_readback_buffer(self) -> moderngl.Buffer:
+        if not self.readback_buffers:
+            n_bytes = self.get_raw_frame_nbytes()
+            self.readback_buffers = [
+                self.ctx.buffer(reserve=n_bytes)
+                for _ in range(max(self.n_readback_buffers, 1))
+            ]
+        # Cycle through the ring, the first buffer is the least recently used
+        buffer = self.readback_buffers.pop(0)
+        self.readback_buffers.append(buffer)
+        return buffer
+
+    def get_raw_fbo_data_async(self) -> list[bytes]:
+        """
+        Starts reading the current frame into a pixel-pack buffer,
+        without waiting on the result, and returns the raw data of
+        whichever earlier frames are no longer in flight. The bytes
+        match those of get_raw_frame_data, they just arrive later, so
+        flush_raw_fbo_data should be called once rendering is done.
+        """
+        result = []
+        if len(self.pending_readbacks) >= max(self.n_readback_buffers, 1):
+            self.last_raw_frame = self.pending_readbacks.popleft().read()
+            result.append(self.last_raw_frame)
+        if self.is_frame_read_back():
+            if self.pending_readbacks:
+                # Read the latest buffer once more, it won't be written over
+                # in the meantime since the ring hands out the buffer used
+                # least recently, which can't be pending
+                self.pending_readbacks.append(self.pending_readbacks[-1])
+            else:
+                result.append(self.last_raw_frame)
+            return result
+
+        buffer = self.get_readback_buffer()
+        set_gpu_stage_label("Camera")
+        with gpu_stage("readback"):
+            fbo, components = self.get_readback_fbo()
+            fbo.read_into(
+                buffer,
+                viewport=fbo.viewport,
+                components=components,
+                dtype='f1',
+            )
+        self.pending_readbacks.append(buffer)
+        self.readback_frame_number = self.n_frames_drawn
+        return result
+
+    def flush_raw_fbo_data(self) -> list[bytes]:
+        """
+        Returns the raw data for all frames whose readback is still pending
+        """
+        result = [buffer.read() for buffer in self.pending_readbacks]
+        self.pending_readbacks.clear()
+        if result:
+            self.last_raw_frame = result[-1]
+        return result
+
+    def release_readback_buffers(self) -> None:
+        self.pending_readbacks.clear()
+        self.readback_frame_number = -1
+        for buffer in self.readback_buffers:
+            buffer.release()
+        self.readback_buffers = []
+
     def get_image(self) -> Image.Image:
         return Image.frombytes(
             'RGBA',
@@ -223,11 +471,21 @@ class Camera(object):
 
     # Rendering
     def capture(self, *mobjects: Mobject) -> None:
-        self.clear()
         self.refresh_uniforms()
+        frame_key = self.get_frame_key(mobjects)
+        if frame_key is not None and frame_key == self.frame_key:
+            # The frame buffer already holds this frame
+            return
+
+        self.clear()
         self.fbo.use()
-        for mobject in mobjects:
-            mobject.render(self.ctx, self.uniforms)
+        to_render = mobjects
+        if self.cache_static_layers:
+            to_render = self.render_static_layer(to_render)
+        for mobject in to_render:
+            self.render_mobject(mobject)
+        self.frame_key = frame_key
+        self.n_frames_drawn += 1
 
         if self.window:
             self.window.swap_buffers()
@@ -235,24 +493,144 @@ class Camera(object):
                 self.blit(self.fbo, self.window_fbo)
                 self.window.swap_buffers()
 
+    def render_mobject(self, mobject: Mobject) -> None:
+        # For profiling, attribute GPU time to the class of what's being drawn,
+        # which for the groups a scene renders means the class of their members
+        source = mobject.submobjects[0] if mobject.submobjects else mobject
+        set_gpu_stage_label(source.__class__.__name__)
+        mobject.render(self.ctx, self.uniforms)
+
+    def get_frame_key(self, mobjects: Sequence[Mobject]) -> Optional[tuple]:
+        """
+        Summarizes the inputs to rendering a full frame, as for the static
+        layer, returning None whenever repeated frames shouldn't be skipped,
+        including when anything is animating or updating.
+        """
+        if not self.skip_repeated_frames or self.window is not None:
+            return None
+        if any(mob.is_changing() for mob in mobjects):
+            return None
+        return self.get_static_layer_key(mobjects)
+
+    def is_frame_read_back(self) -> bool:
+        """
+        Whether the frame last drawn is the frame last read back
+        """
+        return self.readback_frame_number == self.n_frames_drawn
+
+    def render_static_layer(self, mobjects: Sequence[Mobject]) -> Sequence[Mobject]:
+        """
+        Draws the longest run of mobjects at the bottom of the z-order which
+        are neither animating nor updating, either by rendering them and
+        storing the result, or, when nothing they depend on has changed since,
+        by copying that stored result into the frame buffer.
+
+        Returns the mobjects which remain to be rendered.
+
+        Only the bottom run is cached, since mobjects are blended directly
+        onto what's below them, and a layer drawn in isolation would not
+        composite to the same result.
+        """
+        # Window framebuffers may not have a depth format one can copy into
+        if self.fbo is self.window_fbo:
+            return mobjects
+
+        n_static = 0
+        for mobject in mobjects:
+            if mobject.is_changing():
+                break
+            n_static += 1
+        if n_static == 0:
+            self.static_layer_key = None
+            return mobjects
+
+        static_mobjects = mobjects[:n_static]
+        key = self.get_static_layer_key(static_mobjects)
+        layer_fbo = self.get_static_layer_fbo()
+        if key is not None and key == self.static_layer_key:
+            self.copy_fbo(layer_fbo, self.fbo)
+        else:
+            for mobject in static_mobjects:
+                self.render_mobject(mobject)
+            self.copy_fbo(self.fbo, layer_fbo)
+            self.static_layer_key = self.get_static_layer_key(static_mobjects)
+        self.fbo.use()
+        return mobjects[n_static:]
+
+    def get_static_layer_key(self, mobjects: Sequence[Mobject]) -> Optional[tuple]:
+        """
+        Summarizes everything the stored static layer depends on: which
+        mobjects are in it, the uniforms used to draw them, the camera's
+        view and lighting, and the frame buffer being drawn to. Returns
+        None if any of the mobjects have data not yet sent to the GPU.
+        """
+        if any(mob._data_has_changed for mob in mobjects):
+            return None
+        return (
+            tuple(map(id, mobjects)),
+            tuple(
+                get_uniforms_key(wrapper.mobject_uniforms)
+                for mob in mobjects
+                for wrapper in mob.shader_wrappers
+            ),
+            self.uniform_block_data.tobytes(),
+            get_uniforms_key(self.uniforms),
+            tuple(self.background_rgba),
+            self.fbo.glo,
+        )
+
+    def get_static_layer_fbo(self) -> moderngl.Framebuffer:
+        fbo = self.static_layer_fbo
+        if fbo is None or fbo.size != self.fbo.size or fbo.samples != self.fbo.samples:
+            if fbo is not None:
+                fbo.release()
+            self.static_layer_fbo = self.ctx.framebuffer(
+                color_attachments=self.ctx.texture(
+                    self.fbo.size,
+                    components=self.n_channels,
+                    samples=self.fbo.samples,
+                ),
+                depth_attachment=self.ctx.depth_renderbuffer(
+                    self.fbo.size,
+                    samples=self.fbo.samples,
+                )
+            )
+            self.static_layer_key = None
+        return self.static_layer_fbo
+
+    def copy_fbo(self, src_fbo: moderngl.Framebuffer, dst_fbo: moderngl.Framebuffer) -> None:
+        """
+        Copy both color and depth between fbo's of the same size and format
+        """
+        gl.glBindFramebuffer(gl.GL_READ_FRAMEBUFFER, src_fbo.glo)
+        gl.glBindFramebuffer(gl.GL_DRAW_FRAMEBUFFER, dst_fbo.glo)
+        gl.glBlitFramebuffer(
+            *src_fbo.viewport,
+            *dst_fbo.viewport,
+            gl.GL_COLOR_BUFFER_BIT | gl.GL_DEPTH_BUFFER_BIT, gl.GL_NEAREST
+        )
+
     def refresh_uniforms(self) -> None:
         frame = self.frame
         view_matrix = frame.get_view_matrix()
         light_pos = self.light_source.get_location()
         cam_pos = self.frame.get_implied_camera_location()
 
-        self.uniforms.update(
-            view=tuple(view_matrix.T.flatten()),
-            frame_scale=frame.get_scale(),
-            frame_rescale_factors=(
-                2.0 / FRAME_WIDTH,
-                2.0 / FRAME_HEIGHT,
-                frame.get_scale() / frame.get_focal_distance(),
-            ),
-            pixel_size=self.get_pixel_size(),
-            camera_position=tuple(cam_pos),
-            light_position=tuple(light_pos),
+        data = self.uniform_block_data
+        data[0:16] = view_matrix.T.flatten()
+        data[16:19] = (
+            2.0 / FRAME_WIDTH,
+            2.0 / FRAME_HEIGHT,
+            frame.get_scale() / frame.get_focal_distance(),
         )
+        data[19] = frame.get_scale()
+        data[20:23] = cam_pos
+        data[23] = self.get_pixel_size()
+        data[24:27] = light_pos
+
+        # One write serves every program drawn this frame
+        self.uniform_buffer.write(data)
+        self.uniform_buffer.bind_to_uniform_block(CAMERA_UNIFORM_BINDING)
 
 
 # Mostly just defined so old scenes don't break
@@ -190,11 +190,32 @@ def parse_cli():
             action="store_true",
             help="Show progress bar for each animation",
         )
+        parser.add_argument(
+            "--gpu_profile",
+            action="store_true",
+            help="Time the GPU work of each render stage, by mobject class, " + \
+                 "and print a report once the scene ends",
+        )
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="Time each updater, animation interpolation, frame capture, " + \
+                 "readback and frame write, by play, printing a report once " + \
+                 "the scene ends and writing a Chrome trace file next to the output",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="When writing to a movie file, split the scene's animations " + \
+                 "between this many processes, and join the results",
+        )
         parser.add_argument(
             "--prerun",
             action="store_true",
             help="Calculate total framecount, to display in a progress bar, by doing " + \
-                 "an initial run of the scene which skips animations."
+                 "an initial run of the scene which skips animations, unless a count " + \
+                 "was recorded from an earlier render of the same source."
         )
         parser.add_argument(
             "--video_dir",
@@ -218,6 +239,13 @@ def parse_cli():
             action="store_true",
             help="Erase the cache used for Tex and Text Mobjects"
         )
+        parser.add_argument(
+            "--warm-cache",
+            action="store_true",
+            help="Rather than rendering, compile the Tex and Text Mobjects " + \
+                 "whose arguments can be read from the file, without running " + \
+                 "it, into the cache, so that later renders don't wait on them"
+        )
         parser.add_argument(
             "--autoreload",
             action="store_true",
@@ -310,6 +338,10 @@ def update_scene_config(config: Dict, args: Namespace):
         scene_config.leave_progress_bars = True
     if args.show_animation_progress:
         scene_config.show_animation_progress = True
+    if args.gpu_profile:
+        scene_config.gpu_profile = True
+    if args.profile:
+        scene_config.profile = True
 
 
 def update_run_config(config: Dict, args: Namespace):
@@ -318,6 +350,7 @@ def update_run_config(config: Dict, args: Namespace):
         embed_line=(int(args.embed) if args.embed is not None else None),
         is_reload=False,
         prerun=args.prerun,
+        workers=args.workers,
         scene_names=args.scene_names,
         quiet=args.quiet or args.write_all,
         write_all=args.write_all,
@@ -4,19 +4,24 @@ import copy
 import inspect
 import sys
 
+from addict import Dict
+
 from manimlib.module_loader import ModuleLoader
 
 from manimlib.config import manim_config
 from manimlib.logger import log
+from manimlib.parallel_render import ParallelSceneRenderer
 from manimlib.scene.interactive_scene import InteractiveScene
 from manimlib.scene.scene import Scene
+from manimlib.utils.cache import get_cached_value
+from manimlib.utils.cache import set_cached_value
+from manimlib.utils.simple_functions import hash_string
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     Module = importlib.util.types.ModuleType
     from typing import Optional
-    from addict import Dict
 
 
 class BlankScene(InteractiveScene):
@@ -60,12 +65,10 @@ def prompt_user_for_choice(scene_classes):
         sys.exit(1)
 
 
-def compute_total_frames(scene_class, scene_config):
+def prerun_scene(scene_class, scene_config):
     """
-    When a scene is being written to file, a copy of the scene is run with
-    skip_animations set to true so as to count how many frames it will require.
-    This allows for a total progress bar on rendering, and also allows runtime
-    errors to be exposed preemptively for long running scenes.
+    Runs a copy of the scene with skip_animations set to true, writing
+    nothing, and returns it
     """
     pre_config = copy.deepcopy(scene_config)
     pre_config["file_writer_config"]["write_to_movie"] = False
@@ -74,14 +77,59 @@ def compute_total_frames(scene_class, scene_config):
     pre_config["skip_animations"] = True
     pre_scene = scene_class(**pre_config)
     pre_scene.run()
-    total_time = pre_scene.time - pre_scene.skip_time
-    return int(total_time * manim_config.camera.fps)
+    return pre_scene
+
+
+def get_frame_count_key(scene_class, scene_config) -> str:
+    """
+    Identifies a scene by its name, the contents of the file defining it,
+    and whatever else bears on how many frames it will write
+    """
+    try:
+        with open(inspect.getsourcefile(scene_class)) as fp:
+            source = fp.read()
+    except (OSError, TypeError):
+        source = ""
+    return "frame_count_" + hash_string("".join(map(str, [
+        source,
+        scene_class.__name__,
+        manim_config.camera.fps,
+        scene_config.get("start_at_animation_number"),
+        scene_config.get("end_at_animation_number"),
+    ])))
+
+
+def compute_total_frames(scene_class, scene_config, run_config):
+    """
+    When a scene is being written to file, the number of frames it will require
+    allows for a total progress bar on rendering. This is taken from the last
+    time the same scene was written from the same source. Failing that, with
+    prerun, a copy of the scene is run with skip_animations set to true so as
+    to count its frames, which also exposes runtime errors preemptively for
+    long running scenes. Otherwise, this returns 0, and the progress bar's
+    total grows as each play comes up.
+    """
+    key = get_frame_count_key(scene_class, scene_config)
+    total_frames = get_cached_value(key)
+    if total_frames is None and run_config.prerun:
+        pre_scene = prerun_scene(scene_class, scene_config)
+        total_time = pre_scene.time - pre_scene.skip_time
+        total_frames = int(total_time * manim_config.camera.fps)
+        set_cached_value(key, total_frames)
+    return total_frames or 0
 
 
 def scene_from_class(scene_class, scene_config: Dict, run_config: Dict):
     fw_config = manim_config.file_writer
-    if fw_config.write_to_movie and run_config.prerun:
-        scene_config.file_writer_config.total_frames = compute_total_frames(scene_class, scene_config)
+    n_workers = run_config.workers or 1
+    if fw_config.write_to_movie and not fw_config.subdivide_output and n_workers > 1:
+        return ParallelSceneRenderer(scene_class, scene_config, run_config, n_workers)
+    if fw_config.write_to_movie:
+        # Each scene gets its own frame count, so copy the configuration
+        scene_config = Dict(scene_config)
+        fw_scene_config = scene_config.file_writer_config
+        fw_scene_config.total_frames = compute_total_frames(scene_class, scene_config, run_config)
+        fw_scene_config.frame_count_key = get_frame_count_key(scene_class, scene_config)
     return scene_class(**scene_config)
 
 
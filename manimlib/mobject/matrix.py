@@ -8,6 +8,7 @@ from manimlib.mobject.numbers import DecimalNumber
 from manimlib.mobject.svg.tex_mobject import Tex
 from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.mobject.types.vectorized_mobject import VMobject
+from manimlib.utils.tex_file_writing import compile_latex_batch
 
 from typing import TYPE_CHECKING
 
@@ -92,6 +93,16 @@ class Matrix(VMobject):
         """
         Creates and organizes the matrix of mobjects
         """
+        # Compile the LaTeX of all elements which become Tex together,
+        # unless a subclass might create its elements differently
+        if type(self).element_to_mobject is Matrix.element_to_mobject:
+            compile_latex_batch([
+                item
+                for row in matrix
+                for element in row
+                if not isinstance(element, VMobject | float | complex)
+                for item in Tex.get_latex_items(str(element), **element_config)
+            ])
         mob_matrix = [
             [
                 self.element_to_mobject(element, **element_config)
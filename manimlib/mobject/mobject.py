@@ -38,8 +38,10 @@ from manimlib.utils.iterables import resize_preserving_order
 from manimlib.utils.iterables import resize_with_interpolation
 from manimlib.utils.bezier import integer_interpolate
 from manimlib.utils.bezier import interpolate
+from manimlib.utils.cpu_profiling import cpu_section
 from manimlib.utils.paths import straight_path
 from manimlib.utils.shaders import get_colormap_code
+from manimlib.utils.shaders import get_uniforms_key
 from manimlib.utils.space_ops import angle_of_vector
 from manimlib.utils.space_ops import get_norm
 from manimlib.utils.space_ops import rotation_matrix_transpose
@@ -109,6 +111,8 @@ class Mobject(object):
         self._is_animating: bool = False
         self._needs_new_bounding_box: bool = True
         self._data_has_changed: bool = True
+        # Incremented whenever data is noted to have changed
+        self._data_version: int = 0
         self.shader_code_replacements: dict[str, str] = dict()
 
         self.init_data()
@@ -204,6 +208,7 @@ class Mobject(object):
 
     def note_changed_data(self, recurse_up: bool = True) -> Self:
         self._data_has_changed = True
+        self._data_version += 1
         if recurse_up:
             for mob in self.parents:
                 mob.note_changed_data()
@@ -687,6 +692,8 @@ class Mobject(object):
         # Similarly, instead of calling match_updaters, since we know the status
         # won't have changed, just directly match.
         result.updaters = list(self.updaters)
+        result.updater_dependencies = dict(self.updater_dependencies)
+        result._updater_input_states = dict()
         result._data_has_changed = True
         result.shader_wrapper = None
 
@@ -816,7 +823,12 @@ class Mobject(object):
 
     def init_updaters(self):
         self.updaters: list[Updater] = list()
+        # Maps updaters to the mobjects they read from, if declared
+        self.updater_dependencies: dict[Updater, list[Mobject]] = dict()
         self._has_updaters_in_family: Optional[bool] = False
+        self._has_updater_dependencies_in_family: Optional[bool] = False
+        self._updater_takes_dt: dict[Updater, bool] = dict()
+        self._updater_input_states: dict[Updater, tuple] = dict()
         self.updating_suspended: bool = False
 
     def update(self, dt: float = 0, recurse: bool = True) -> Self:
@@ -826,19 +838,83 @@ class Mobject(object):
             for submob in self.submobjects:
                 submob.update(dt, recurse)
         for updater in self.updaters:
-            # This is hacky, but if an updater takes dt as an arg,
-            # it will be passed the change in time from here
-            if "dt" in updater.__code__.co_varnames:
-                updater(self, dt=dt)
-            else:
-                updater(self)
-        return self
+            if self.updater_takes_dt(updater):
+                with cpu_section("updater", updater):
+                    updater(self, dt=dt)
+            elif self.updater_inputs_have_changed(updater):
+                with cpu_section("updater", updater):
+                    updater(self)
+        return self
+
+    def updater_takes_dt(self, updater: Updater) -> bool:
+        # This is hacky, but if an updater takes dt as an arg,
+        # it will be passed the change in time from update
+        result = self._updater_takes_dt.get(updater)
+        if result is None:
+            result = "dt" in updater.__code__.co_varnames
+            self._updater_takes_dt[updater] = result
+        return result
+
+    def updater_inputs_have_changed(self, updater: Updater) -> bool:
+        """
+        Whether any of the mobjects the updater was declared to depend on
+        has changed since it was last called, which is always taken to be
+        the case for updaters without declared dependencies
+        """
+        dependencies = self.updater_dependencies.get(updater)
+        if dependencies is None:
+            return True
+        state = tuple(mob.get_state_key() for mob in dependencies)
+        if self._updater_input_states.get(updater) == state:
+            return False
+        self._updater_input_states[updater] = state
+        return True
+
+    def get_state_key(self) -> tuple:
+        """
+        Summarizes the data and uniforms of the family, such that the
+        result changes whenever any of them do, so long as changes to
+        data are noted with note_changed_data
+        """
+        return tuple(
+            (mob, mob._data_version, get_uniforms_key(mob.uniforms))
+            for mob in self.get_family()
+        )
 
     def get_updaters(self) -> list[Updater]:
         return self.updaters
 
-    def add_updater(self, update_func: Updater, call: bool = True) -> Self:
+    def get_updater_dependencies(self) -> list[Mobject]:
+        """
+        Returns the declared dependencies of all updaters in the family
+        """
+        if not self.has_updater_dependencies():
+            return []
+        result = [
+            mob
+            for dependencies in self.updater_dependencies.values()
+            for mob in dependencies
+        ]
+        for submob in self.submobjects:
+            result.extend(submob.get_updater_dependencies())
+        return result
+
+    def add_updater(
+        self,
+        update_func: Updater,
+        call: bool = True,
+        depends_on: Optional[Iterable[Mobject]] = None
+    ) -> Self:
+        """
+        If depends_on is given, it should list every mobject, such as a
+        ValueTracker, which update_func reads from.  Unless the updater takes
+        in dt, it will then only be called on frames where one of those has
+        changed, and within a scene, mobjects holding those dependencies will
+        be updated before this one.
+        """
         self.updaters.append(update_func)
+        if depends_on is not None:
+            self.updater_dependencies[update_func] = list(depends_on)
         if call:
             self.update(dt=0)
         self.refresh_has_updater_status()
@@ -853,19 +929,27 @@ class Mobject(object):
     def remove_updater(self, update_func: Updater) -> Self:
         while update_func in self.updaters:
             self.updaters.remove(update_func)
+        self.updater_dependencies.pop(update_func, None)
+        self._updater_input_states.pop(update_func, None)
         self.refresh_has_updater_status()
         return self
 
     def clear_updaters(self, recurse: bool = True) -> Self:
         for mob in self.get_family(recurse):
             mob.updaters = []
+            mob.updater_dependencies = dict()
+            mob._updater_input_states = dict()
             mob._has_updaters_in_family = False
+            mob._has_updater_dependencies_in_family = False
         for parent in self.get_ancestors():
             parent._has_updaters_in_family = False
+            parent._has_updater_dependencies_in_family = None
         return self
 
     def match_updaters(self, mobject: Mobject) -> Self:
         self.updaters = list(mobject.updaters)
+        self.updater_dependencies = dict(mobject.updater_dependencies)
+        self._updater_input_states = dict()
         self.refresh_has_updater_status()
         return self
 
@@ -895,8 +979,17 @@ class Mobject(object):
             )
         return self._has_updaters_in_family
 
+    def has_updater_dependencies(self) -> bool:
+        if self._has_updater_dependencies_in_family is None:
+            # Recompute and save
+            self._has_updater_dependencies_in_family = bool(self.updater_dependencies) or any(
+                sm.has_updater_dependencies() for sm in self.submobjects
+            )
+        return self._has_updater_dependencies_in_family
+
     def refresh_has_updater_status(self) -> Self:
         self._has_updaters_in_family = None
+        self._has_updater_dependencies_in_family = None
         for parent in self.parents:
             parent.refresh_has_updater_status()
         return self
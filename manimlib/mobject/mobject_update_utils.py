@@ -10,7 +10,7 @@ from manimlib.utils.simple_functions import clip
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Callable
+    from typing import Callable, Iterable
 
     import numpy as np
 
@@ -23,19 +23,23 @@ def assert_is_mobject_method(method):
     assert isinstance(mobject, Mobject)
 
 
-def always(method, *args, **kwargs):
+def always(method, *args, depends_on=None, **kwargs):
     assert_is_mobject_method(method)
     mobject = method.__self__
     func = method.__func__
-    mobject.add_updater(lambda m: func(m, *args, **kwargs))
+    mobject.add_updater(lambda m: func(m, *args, **kwargs), depends_on=depends_on)
     return mobject
 
 
-def f_always(method, *arg_generators, **kwargs):
+def f_always(method, *arg_generators, depends_on=None, **kwargs):
     """
     More functional version of always, where instead
     of taking in args, it takes in functions which output
     the relevant arguments.
+
+    As with Mobject.add_updater, depends_on can list the mobjects
+    which the arg_generators read from, so that the method is only
+    called again when one of them changes.
     """
     assert_is_mobject_method(method)
     mobject = method.__self__
@@ -48,13 +52,18 @@ def f_always(method, *arg_generators, **kwargs):
         ]
         func(mob, *args, **kwargs)
 
-    mobject.add_updater(updater)
+    mobject.add_updater(updater, depends_on=depends_on)
     return mobject
 
 
-def always_redraw(func: Callable[..., Mobject], *args, **kwargs) -> Mobject:
+def always_redraw(
+    func: Callable[..., Mobject],
+    *args,
+    depends_on: Iterable[Mobject] | None = None,
+    **kwargs
+) -> Mobject:
     mob = func(*args, **kwargs)
-    mob.add_updater(lambda m: mob.become(func(*args, **kwargs)))
+    mob.add_updater(lambda m: mob.become(func(*args, **kwargs)), depends_on=depends_on)
     return mob
 
 
@@ -7,6 +7,8 @@ import svgelements as se
 import io
 from pathlib import Path
 
+from manimlib.config import manim_config
+from manimlib.constants import ORIGIN
 from manimlib.constants import RIGHT
 from manimlib.constants import TAU
 from manimlib.logger import log
@@ -18,17 +20,106 @@ from manimlib.mobject.geometry import Rectangle
 from manimlib.mobject.geometry import RoundedRectangle
 from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.utils.bezier import quadratic_bezier_points_for_arc
+from manimlib.utils.cache import LRUCache
+from manimlib.utils.cache import get_cached_value
+from manimlib.utils.cache import set_cached_value
 from manimlib.utils.images import get_full_vector_image_path
 from manimlib.utils.iterables import hash_obj
+from manimlib.utils.iterables import resize_preserving_order
+from manimlib.utils.simple_functions import hash_string
 from manimlib.utils.space_ops import rotation_about_z
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
-    from manimlib.typing import ManimColor, Vect3Array
-
-
-SVG_HASH_TO_MOB_MAP: dict[int, list[VMobject]] = {}
-PATH_TO_POINTS: dict[str, Vect3Array] = {}
+    from typing import Callable, Iterable
+    from manimlib.typing import ManimColor
+
+
+def get_vmobjects_nbytes(vmobjects: list[VMobject]) -> int:
+    return sum(sm.data.nbytes for vmob in vmobjects for sm in vmob.get_family())
+
+
+# Maps hashes of svgs to their parsed submobjects, and svg path strings to
+# their points, see LRUCache for hit, miss and eviction counts
+SVG_HASH_TO_MOB_MAP: LRUCache = LRUCache(
+    int(manim_config.svg.mobject_cache_mb * 1e6), get_vmobjects_nbytes
+)
+PATH_TO_POINTS: LRUCache = LRUCache(
+    int(manim_config.svg.path_cache_mb * 1e6), lambda points: points.nbytes
+)
+# Change whenever parsing changes, so that geometry cached on disk
+# by earlier versions is ignored
+SVG_GEOMETRY_FORMAT = 2
+
+
+def can_store_as_bytes(vmobjects: list[VMobject], classes: Iterable[type]) -> bool:
+    classes = set(classes)
+    return len(vmobjects) > 0 and all(
+        type(vmob) in classes
+        and vmob.data.dtype == VMobject.data_dtype
+        and len(vmob.submobjects) == 0
+        and vmob.uniforms.keys() == vmobjects[0].uniforms.keys()
+        for vmob in vmobjects
+    )
+
+
+def vmobjects_to_bytes(vmobjects: list[VMobject]) -> bytes:
+    """
+    Packs the classes, points, styles, uniforms and any string labels of
+    vmobjects, which should have no submobjects, into an npz file
+    """
+    arrays = dict(
+        classes=np.array([type(vmob).__name__ for vmob in vmobjects]),
+        data=np.concatenate([vmob.data for vmob in vmobjects]),
+        lengths=np.array([len(vmob.data) for vmob in vmobjects]),
+    )
+    for key in vmobjects[0].uniforms:
+        arrays["uniform_" + key] = np.array([vmob.uniforms[key] for vmob in vmobjects])
+    if all(hasattr(vmob, "label") for vmob in vmobjects):
+        arrays["labels"] = np.array([vmob.label for vmob in vmobjects])
+    stream = io.BytesIO()
+    np.savez(stream, **arrays)
+    return stream.getvalue()
+
+
+def vmobjects_from_bytes(
+    npz_bytes: bytes,
+    factories: dict[type, Callable[[], VMobject]]
+) -> list[VMobject]:
+    """
+    Inverse of vmobjects_to_bytes, rebuilding each vmobject by filling
+    in one made by the factory for its class
+    """
+    name_to_factory = {cls.__name__: factory for cls, factory in factories.items()}
+    arrays = np.load(io.BytesIO(npz_bytes))
+    class_names = arrays["classes"].tolist()
+    data = arrays["data"]
+    ends = np.cumsum(arrays["lengths"])
+    uniforms = {
+        name[len("uniform_"):]: arrays[name]
+        for name in arrays.files
+        if name.startswith("uniform_")
+    }
+    labels = arrays["labels"].tolist() if "labels" in arrays.files else None
+
+    result = []
+    for index, (start, end) in enumerate(zip(ends - arrays["lengths"], ends)):
+        vmob = name_to_factory[class_names[index]]()
+        # Much like set_data, but without the cost of np.resize
+        # on structured arrays
+        vmob.resize_points(end - start, resize_func=resize_preserving_order)
+        vmob.data[:] = data[start:end]
+        vmob.subpath_end_indices = None
+        vmob.refresh_joint_angles()
+        vmob.refresh_unit_normal()
+        vmob.set_uniforms({
+            key: values[index].item() if values.ndim == 1 else values[index]
+            for key, values in uniforms.items()
+        })
+        if labels is not None:
+            vmob.label = labels[index]
+        result.append(vmob)
+    return result
 
 
 def _convert_point_to_3d(x: float, y: float) -> np.ndarray:
@@ -82,7 +173,6 @@ class SVGMobject(VMobject):
 
         super().__init__(**kwargs)
         self.init_svg_mobject()
-        self.ensure_positive_orientation()
 
         # Rather than passing style into super().__init__
         # do it after svg has been taken in
@@ -106,15 +196,42 @@ class SVGMobject(VMobject):
             self.set_width(width)
 
     def init_svg_mobject(self) -> None:
+        # Submobjects are cached once flipped and oriented, in memory and,
+        # so that other processes needn't parse the svg again, on disk
         hash_val = hash_obj(self.hash_seed)
-        if hash_val in SVG_HASH_TO_MOB_MAP:
-            submobs = [sm.copy() for sm in SVG_HASH_TO_MOB_MAP[hash_val]]
+        cached_submobs = SVG_HASH_TO_MOB_MAP.get(hash_val)
+        if cached_submobs is not None:
+            self.add(*(sm.copy() for sm in cached_submobs))
+            return
+
+        disk_key = hash_string(f"svg_geometry{SVG_GEOMETRY_FORMAT}{self.hash_seed}")
+        geometry = get_cached_value(disk_key)
+        factories = self.get_cacheable_submobject_factories()
+        if geometry is not None:
+            self.add(*vmobjects_from_bytes(geometry, factories))
         else:
-            submobs = self.mobjects_from_svg_string(self.svg_string)
-            SVG_HASH_TO_MOB_MAP[hash_val] = [sm.copy() for sm in submobs]
-
-        self.add(*submobs)
-        self.flip(RIGHT)  # Flip y
+            self.add(*self.mobjects_from_svg_string(self.svg_string))
+            self.flip(RIGHT)  # Flip y
+            self.ensure_positive_orientation()
+            if can_store_as_bytes(self.submobjects, factories):
+                set_cached_value(disk_key, vmobjects_to_bytes(self.submobjects))
+        SVG_HASH_TO_MOB_MAP[hash_val] = [sm.copy() for sm in self.submobjects]
+
+    def get_cacheable_submobject_factories(self) -> dict[type, Callable[[], VMobject]]:
+        """
+        Maps the classes of submobjects which hold nothing beyond their
+        data and uniforms, so can be rebuilt from geometry cached on disk,
+        to functions making instances for that geometry to be loaded into.
+        Svgs with submobjects of any other class are only cached in memory.
+        """
+        return {
+            VMobject: VMobject,
+            VMobjectFromSVGPath: lambda: VMobjectFromSVGPath(se.Path(), **self.path_string_config),
+            Polygon: lambda: Polygon(ORIGIN),
+            Polyline: Polyline,
+            Rectangle: Rectangle,
+            RoundedRectangle: RoundedRectangle,
+        }
 
     @property
     def hash_seed(self) -> tuple:
@@ -314,12 +431,12 @@ class VMobjectFromSVGPath(VMobject):
         # will be saved so that future calls for the same pathdon't need to
         # retrace the same computation.
         path_string = self.path_obj.d()
-        if path_string not in PATH_TO_POINTS:
+        points = PATH_TO_POINTS.get(path_string)
+        if points is None:
             self.handle_commands()
             # Save for future use
             PATH_TO_POINTS[path_string] = self.get_points().copy()
         else:
-            points = PATH_TO_POINTS[path_string]
             self.set_points(points)
 
     def handle_commands(self) -> None:
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import inspect
 import re
 from pathlib import Path
 
+from manimlib.constants import DEFAULT_MOBJECT_COLOR
 from manimlib.mobject.svg.string_mobject import StringMobject
 from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.utils.color import color_to_hex
 from manimlib.utils.color import hex_to_int
+from manimlib.utils.tex_file_writing import compile_latex_batch
 from manimlib.utils.tex_file_writing import latex_to_svg
 from manimlib.utils.tex import num_tex_symbols
 from manimlib.logger import log
@@ -15,6 +18,7 @@ from manimlib.logger import log
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from typing import Callable
     from manimlib.typing import ManimColor, Span, Selector, Self
 
 
@@ -37,6 +41,31 @@ class Tex(StringMobject):
         use_labelled_svg: bool = True,
         **kwargs
     ):
+        isolate = self.init_tex_attributes(
+            tex_strings, isolate, alignment, template, additional_preamble
+        )
+        self.tex_to_color_map = dict(**t2c, **tex_to_color_map)
+
+        super().__init__(
+            self.tex_string,
+            use_labelled_svg=use_labelled_svg,
+            isolate=isolate,
+            **kwargs
+        )
+
+        self.set_color_by_tex_to_color_map(self.tex_to_color_map)
+        self.scale(TEX_MOB_SCALE_FACTOR * font_size)
+
+        self.font_size = font_size  # Important for this to go after the scale call
+
+    def init_tex_attributes(
+        self,
+        tex_strings: tuple[str, ...],
+        isolate: Selector,
+        alignment: str,
+        template: str,
+        additional_preamble: str,
+    ) -> Selector:
         # Combine multi-string arg, but mark them to isolate
         if len(tex_strings) > 1:
             if isinstance(isolate, (str, re.Pattern, tuple)):
@@ -53,19 +82,40 @@ class Tex(StringMobject):
         self.alignment = alignment
         self.template = template
         self.additional_preamble = additional_preamble
-        self.tex_to_color_map = dict(**t2c, **tex_to_color_map)
-
-        super().__init__(
-            tex_string,
-            use_labelled_svg=use_labelled_svg,
-            isolate=isolate,
-            **kwargs
+        return isolate
+
+    @classmethod
+    def get_latex_items(cls, *tex_strings: str, **kwargs) -> list[tuple[str, str, str, str]]:
+        """
+        Returns the LaTeX which cls(*tex_strings, **kwargs) compiles, as
+        items for compile_latex_batch, without compiling or building anything
+        """
+        if cls.__init__ is not Tex.__init__:
+            raise TypeError(f"{cls.__name__} can only find its LaTeX by being built")
+        bound_args = inspect.signature(Tex.__init__).bind(None, *tex_strings, **kwargs)
+        bound_args.apply_defaults()
+        args = bound_args.arguments
+        extra_kwargs = args["kwargs"]
+        # Parse as StringMobject.__init__ would, on an instance that is
+        # never built, nor handed out
+        tex = cls.__new__(cls)
+        tex.isolate = tex.init_tex_attributes(
+            args["tex_strings"], args["isolate"], args["alignment"],
+            args["template"], args["additional_preamble"],
         )
-
-        self.set_color_by_tex_to_color_map(self.tex_to_color_map)
-        self.scale(TEX_MOB_SCALE_FACTOR * font_size)
-
-        self.font_size = font_size  # Important for this to go after the scale call
+        tex.tex_to_color_map = dict(**args["t2c"], **args["tex_to_color_map"])
+        tex.string = tex.tex_string
+        tex.base_color = extra_kwargs.get("base_color") or DEFAULT_MOBJECT_COLOR
+        tex.protect = extra_kwargs.get("protect", ())
+        tex.use_labelled_svg = args["use_labelled_svg"]
+        tex.parse()
+        contents = [tex.get_content(tex.use_labelled_svg)]
+        if not tex.use_labelled_svg:
+            contents.append(tex.get_content(is_labelled=True))
+        return [
+            (content, tex.template, tex.additional_preamble, tex.tex_string)
+            for content in contents
+        ]
 
     def get_svg_string_by_content(self, content: str) -> str:
         return latex_to_svg(content, self.template, self.additional_preamble, short_tex=self.tex_string)
@@ -267,5 +317,42 @@ class Tex(StringMobject):
         return decimal_mobs[index]
 
 
+class TexBatch(object):
+    """
+    Collects the LaTeX of Tex and TexText mobjects before any of them
+    are built, so that it can all be compiled in one go with
+    compile_latex_batch, e.g.
+
+        with TexBatch() as batch:
+            makers = [batch.add(str(n)) for n in range(40)]
+        labels = VGroup(*(make() for make in makers))
+
+    Each call to add returns a function building that mobject, which
+    then finds its svgs already in the cache.
+    """
+    def __init__(self):
+        self.latex_items: list[tuple[str, str, str, str]] = []
+
+    def __enter__(self) -> TexBatch:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.compile()
+
+    def add(
+        self,
+        *tex_strings: str,
+        tex_class: type[Tex] = Tex,
+        **kwargs
+    ) -> Callable[[], Tex]:
+        self.latex_items.extend(tex_class.get_latex_items(*tex_strings, **kwargs))
+        return lambda: tex_class(*tex_strings, **kwargs)
+
+    def compile(self) -> None:
+        compile_latex_batch(self.latex_items)
+        self.latex_items = []
+
+
 class TexText(Tex):
     tex_environment: str = ""
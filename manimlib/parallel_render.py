@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import copy
+import multiprocessing
+import os
+import shutil
+import subprocess as sp
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from pydub import AudioSegment
+
+from manimlib.config import manim_config
+from manimlib.logger import log
+from manimlib.scene.scene_file_writer import add_audio_to_movie
+from manimlib.utils.file_ops import guarantee_existence
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Optional, Type
+    from addict import Dict
+    from manimlib.scene.scene import Scene
+
+
+class ParallelSceneRenderer(object):
+    """
+    Stands in for a scene which is to be written to a movie file, splitting
+    its play and wait calls into contiguous ranges of roughly equal duration,
+    and rendering each range in a separate process, which skips through every
+    play before its range. The partial movies are then concatenated without
+    re-encoding, and any sounds they had are combined into one track.
+    """
+    def __init__(
+        self,
+        scene_class: Type[Scene],
+        scene_config: Dict,
+        run_config: Dict,
+        n_workers: int,
+    ):
+        self.scene_class = scene_class
+        self.scene_config = scene_config
+        self.run_config = run_config
+        self.n_workers = n_workers
+
+    def __str__(self) -> str:
+        return self.scene_class.__name__
+
+    def run(self) -> None:
+        fw_config = manim_config.file_writer
+        if fw_config.movie_file_extension == ".gif":
+            log.warning("Gifs cannot be concatenated losslessly, so will be rendered in one process")
+            self.scene_class(**self.scene_config).run()
+            return
+
+        ranges = get_play_ranges(
+            self.get_play_end_times(),
+            self.n_workers,
+            self.scene_config.get("start_at_animation_number"),
+            self.scene_config.get("end_at_animation_number"),
+        )
+        if len(ranges) < 2:
+            self.scene_class(**self.scene_config).run()
+            return
+
+        movie_path = self.get_movie_file_path()
+        parts_dir = tempfile.mkdtemp(prefix=f".{movie_path.stem}_parts_", dir=movie_path.parent)
+        try:
+            parts = self.render_ranges(ranges, parts_dir)
+            concat_movies([movie for movie, audio in parts], str(movie_path), fw_config.ffmpeg_bin)
+            audio_files = [audio for movie, audio in parts if audio is not None]
+            if audio_files:
+                add_audio_to_movie(str(movie_path), merge_audio_files(audio_files), fw_config.ffmpeg_bin)
+        finally:
+            shutil.rmtree(parts_dir, ignore_errors=True)
+
+        if not fw_config.quiet:
+            log.info(f"File ready at {movie_path}")
+
+    def get_play_end_times(self) -> list[float]:
+        from manimlib.extract_scene import prerun_scene
+        return prerun_scene(self.scene_class, self.scene_config).play_end_times
+
+    def get_movie_file_path(self) -> Path:
+        fw_config = manim_config.file_writer
+        name = fw_config.file_name or self.scene_class.__name__
+        directory = guarantee_existence(fw_config.output_directory)
+        return Path(directory, name).with_suffix(fw_config.movie_file_extension)
+
+    def render_ranges(
+        self,
+        ranges: list[tuple[int, Optional[int]]],
+        parts_dir: str
+    ) -> list[tuple[str, Optional[str]]]:
+        log.info(
+            f"Rendering {self} with {len(ranges)} workers, " + \
+            "splitting at plays " + ", ".join(str(start) for start, end in ranges[1:])
+        )
+        # Forked processes would inherit this process's OpenGL state
+        mp_context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(len(ranges), mp_context=mp_context) as pool:
+            futures = [
+                pool.submit(
+                    render_scene_range,
+                    self.run_config.to_dict(),
+                    self.scene_config.to_dict(),
+                    self.scene_class.__name__,
+                    start, end,
+                    parts_dir, f"{index:05}",
+                )
+                for index, (start, end) in enumerate(ranges)
+            ]
+            return [future.result() for future in futures]
+
+
+def get_play_ranges(
+    play_end_times: list[float],
+    n_parts: int,
+    start: Optional[int] = None,
+    end: Optional[int] = None,
+) -> list[tuple[int, Optional[int]]]:
+    """
+    Splits the plays from start up to end into at most n_parts contiguous
+    ranges, each taking roughly the same amount of scene time. The last range
+    is left open-ended if it runs through the end of the scene.
+    """
+    n_plays = len(play_end_times)
+    start = start or 0
+    end = n_plays if end is None else min(end, n_plays)
+    if end - start < 1:
+        return [(start, None)]
+
+    start_times = [0.0, *play_end_times[:-1]]
+    durations = [t1 - t0 for t0, t1 in zip(start_times, play_end_times)]
+    target = sum(durations[start:end]) / n_parts
+
+    boundaries = [start]
+    elapsed = 0.0
+    for index in range(start, end - 1):
+        elapsed += durations[index]
+        if len(boundaries) < n_parts and elapsed >= target * len(boundaries):
+            boundaries.append(index + 1)
+
+    ends = [*boundaries[1:], None if end == n_plays else end]
+    return list(zip(boundaries, ends))
+
+
+def render_scene_range(
+    run_config: dict,
+    scene_config: dict,
+    scene_name: str,
+    start: int,
+    end: Optional[int],
+    output_directory: str,
+    file_name: str,
+) -> tuple[str, Optional[str]]:
+    """
+    Runs in a worker process, writing the plays from start up to end to a movie
+    in output_directory, and returns the path to that movie along with the path
+    of a .wav file holding its sounds, if it has any.
+    """
+    from addict import Dict
+    from manimlib.extract_scene import get_module
+    from manimlib.extract_scene import get_scene_classes
+
+    module = get_module(Dict(run_config))
+    name_to_class = {sc.__name__: sc for sc in get_scene_classes(module)}
+    config = copy.deepcopy(scene_config)
+    config.update(
+        start_at_animation_number=start,
+        end_at_animation_number=end,
+        show_animation_progress=False,
+        presenter_mode=False,
+    )
+    config["file_writer_config"] = dict(
+        config.get("file_writer_config", dict()),
+        write_to_movie=True,
+        subdivide_output=False,
+        save_last_frame=False,
+        output_directory=output_directory,
+        file_name=file_name,
+        open_file_upon_completion=False,
+        show_file_location_upon_completion=False,
+        quiet=True,
+        total_frames=0,
+        separate_audio_file=True,
+    )
+    scene = name_to_class[scene_name](**config)
+    scene.run()
+
+    file_writer = scene.file_writer
+    audio_path = file_writer.get_audio_file_path() if file_writer.includes_sound else None
+    return str(file_writer.get_movie_file_path()), audio_path
+
+
+def concat_movies(movie_paths: list[str], output_path: str, ffmpeg_bin: str = "ffmpeg") -> None:
+    """
+    Joins movies with identical encoding settings, copying their streams
+    """
+    list_path = os.path.splitext(output_path)[0] + "_parts.txt"
+    with open(list_path, "w") as fp:
+        for path in movie_paths:
+            fp.write("file '{}'\n".format(Path(path).absolute().as_posix().replace("'", "'\\''")))
+    sp.call([
+        ffmpeg_bin,
+        '-y',  # overwrite output file if it exists
+        '-f', 'concat',
+        '-safe', '0',
+        '-i', list_path,
+        '-c', 'copy',
+        '-loglevel', 'error',
+        output_path,
+    ])
+    os.remove(list_path)
+
+
+def merge_audio_files(audio_paths: list[str]) -> AudioSegment:
+    """
+    Combines sound tracks which each already start from the beginning of the
+    scene, since sounds are placed according to scene time
+    """
+    segments = [AudioSegment.from_wav(path) for path in audio_paths]
+    result = AudioSegment.silent(int(1000 * max(seg.duration_seconds for seg in segments)))
+    for segment in segments:
+        result = result.overlay(segment)
+    return result
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections import OrderedDict
+import heapq
 import platform
 import random
 import time
@@ -28,9 +29,15 @@ from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.scene.scene_embed import InteractiveSceneEmbed
 from manimlib.scene.scene_embed import CheckpointManager
 from manimlib.scene.scene_file_writer import SceneFileWriter
+from manimlib.utils.cpu_profiling import CPUProfiler
+from manimlib.utils.cpu_profiling import cpu_section
+from manimlib.utils.cpu_profiling import set_active_cpu_profiler
 from manimlib.utils.dict_ops import merge_dicts_recursively
 from manimlib.utils.family_ops import extract_mobject_family_members
 from manimlib.utils.family_ops import recursive_mobject_remove
+from manimlib.utils.fingerprint import Fingerprint
+from manimlib.utils.gpu_profiling import GPUProfiler
+from manimlib.utils.gpu_profiling import set_active_gpu_profiler
 from manimlib.utils.iterables import batch_by_property
 from manimlib.utils.sounds import play_sound
 from manimlib.utils.color import color_to_rgba
@@ -75,6 +82,8 @@ class Scene(object):
         preview_while_skipping: bool = True,
         presenter_mode: bool = False,
         default_wait_time: float = 1.0,
+        gpu_profile: bool = False,
+        profile: bool = False,
     ):
         self.skip_animations = skip_animations
         self.always_update_mobjects = always_update_mobjects
@@ -85,6 +94,8 @@ class Scene(object):
         self.preview_while_skipping = preview_while_skipping
         self.presenter_mode = presenter_mode
         self.default_wait_time = default_wait_time
+        self.gpu_profile = gpu_profile
+        self.profile = profile
 
         self.camera_config = merge_dicts_recursively(
             manim_config.camera,         # Global default
@@ -113,11 +124,25 @@ class Scene(object):
         self.frame.reorient(*self.default_frame_orientation)
         self.frame.make_orientation_default()
 
+        self.gpu_profiler: GPUProfiler | None = None
+        if self.gpu_profile:
+            self.gpu_profiler = GPUProfiler(self.camera.ctx)
+            set_active_gpu_profiler(self.gpu_profiler)
+
+        self.cpu_profiler: CPUProfiler | None = None
+        if self.profile:
+            self.cpu_profiler = CPUProfiler()
+            set_active_cpu_profiler(self.cpu_profiler)
+
         self.file_writer = SceneFileWriter(self, **self.file_writer_config)
         self.mobjects: list[Mobject] = [self.camera.frame]
         self.render_groups: list[Mobject] = []
         self.id_to_mobject_map: dict[int, Mobject] = dict()
         self.num_plays: int = 0
+        # Scene time at the end of each play or wait call
+        self.play_end_times: list[float] = []
+        # Whether the current play's partial movie came from the cache
+        self.playing_from_cache: bool = False
         self.time: float = 0
         self.skip_time: float = 0
         self.original_skipping_status: bool = self.skip_animations
@@ -151,7 +176,8 @@ class Scene(object):
         self.real_animation_start_time: float = time.time()
         self.file_writer.begin()
 
-        self.setup()
+        with cpu_section("setup", "Scene.setup"):
+            self.setup()
         try:
             self.construct()
             self.interact()
@@ -179,6 +205,18 @@ class Scene(object):
     def tear_down(self) -> None:
         self.stop_skipping()
         self.file_writer.finish()
+        if self.gpu_profiler is not None:
+            log.info(self.gpu_profiler.get_report())
+            set_active_gpu_profiler(None)
+            self.gpu_profiler.release()
+            self.gpu_profiler = None
+        if self.cpu_profiler is not None:
+            trace_path = self.file_writer.get_profile_trace_path()
+            self.cpu_profiler.write_trace(trace_path)
+            log.info(self.cpu_profiler.get_report())
+            log.info(f"CPU profile trace written to {trace_path}")
+            set_active_cpu_profiler(None)
+            self.cpu_profiler = None
         if self.window:
             self.window.destroy()
             self.window = None
@@ -236,7 +274,7 @@ class Scene(object):
     def update_frame(self, dt: float = 0, force_draw: bool = False) -> None:
         self.increment_time(dt)
         self.update_mobjects(dt)
-        if self.skip_animations and not force_draw:
+        if (self.skip_animations or self.playing_from_cache) and not force_draw:
             return
 
         if self.is_window_closing():
@@ -248,7 +286,8 @@ class Scene(object):
             self.window._window.dispatch_events()
             return
 
-        self.camera.capture(*self.render_groups)
+        with cpu_section("capture", "Camera.capture"):
+            self.camera.capture(*self.render_groups)
 
         if self.window and not self.skip_animations:
             vt = self.time - self.virtual_animation_start_time
@@ -256,15 +295,54 @@ class Scene(object):
             time.sleep(max(vt - rt, 0))
 
     def emit_frame(self) -> None:
-        if not self.skip_animations:
+        if not self.skip_animations and not self.playing_from_cache:
             self.file_writer.write_frame(self.camera)
 
     # Related to updating
 
     def update_mobjects(self, dt: float) -> None:
-        for mobject in self.mobjects:
+        for mobject in self.get_update_order():
             mobject.update(dt)
 
+    def get_update_order(self) -> list[Mobject]:
+        """
+        Orders the scene's mobjects so that those holding the declared
+        dependencies of another's updaters are updated before it, and
+        otherwise keeps them in the order they were added.  Dependencies
+        which form a cycle are left in their original order.
+        """
+        mobjects = self.mobjects
+        if not any(mob.has_updater_dependencies() for mob in mobjects):
+            return mobjects
+        indices = {id(mob): i for i, mob in enumerate(mobjects)}
+        prerequisites = [set() for mob in mobjects]
+        for i, mob in enumerate(mobjects):
+            for dependency in mob.get_updater_dependencies():
+                for holder in (dependency, *dependency.get_ancestors()):
+                    j = indices.get(id(holder))
+                    if j is not None and j != i:
+                        prerequisites[i].add(j)
+        if not any(prerequisites):
+            return mobjects
+
+        dependents = [[] for mob in mobjects]
+        for i, prereqs in enumerate(prerequisites):
+            for j in prereqs:
+                dependents[j].append(i)
+        n_waiting_on = list(map(len, prerequisites))
+        ready = [i for i, n in enumerate(n_waiting_on) if n == 0]
+        order = []
+        while ready:
+            i = heapq.heappop(ready)
+            order.append(i)
+            for j in dependents[i]:
+                n_waiting_on[j] -= 1
+                if n_waiting_on[j] == 0:
+                    heapq.heappush(ready, j)
+        ordered = set(order)
+        order.extend(i for i in range(len(mobjects)) if i not in ordered)
+        return [mobjects[i] for i in order]
+
     def should_update_mobjects(self) -> bool:
         return self.always_update_mobjects or any(
             mob.has_updaters() for mob in self.mobjects
@@ -477,6 +555,8 @@ class Scene(object):
         times = np.arange(0, run_time, 1 / self.camera.fps) + 1 / self.camera.fps
 
         self.file_writer.set_progress_display_description(sub_desc=desc)
+        if n_iterations is None:
+            self.file_writer.expect_frames(len(times))
 
         if self.show_animation_progress:
             return ProgressDisplay(
@@ -516,28 +596,84 @@ class Scene(object):
             kw["override_skip_animations"] = True
         return self.get_time_progression(duration, **kw)
 
-    def pre_play(self):
+    def get_play_cache_key(self, *play_inputs) -> str | None:
+        """
+        Fingerprints everything which determines the frames of the upcoming
+        play or wait call, for reusing partial movies between runs.  This is
+        best-effort, e.g. globals read by updaters are not accounted for.
+        """
+        if not self.file_writer.uses_partial_movie_cache() or self.presenter_mode:
+            return None
+        camera = self.camera
+        file_writer = self.file_writer
+        # Bring what's derived from the camera frame up to date, as drawing would
+        camera.refresh_uniforms()
+
+        fingerprint = Fingerprint()
+        fingerprint.add_reference(self, "scene")
+        fingerprint.add(play_inputs)
+        fingerprint.add(self.mobjects)
+        fingerprint.add(self.time)
+        fingerprint.add(random.getstate())
+        fingerprint.add(np.random.get_state())
+        fingerprint.add((
+            camera.get_pixel_shape(),
+            camera.fps,
+            camera.samples,
+            camera.readback_pixel_format,
+            camera.background_rgba,
+            camera.uniforms,
+            camera.uniform_block_data,
+        ))
+        fingerprint.add((
+            file_writer.video_encoder,
+            file_writer.video_codec,
+            file_writer.pixel_format,
+            file_writer.movie_file_extension,
+            file_writer.saturation,
+            file_writer.gamma,
+        ))
+        return fingerprint.hexdigest()
+
+    def pre_play(self, *play_inputs):
         if self.presenter_mode and self.num_plays == 0:
             self.hold_loop()
 
+        if self.cpu_profiler is not None:
+            kind, *args = play_inputs
+            name = " ".join(map(str, args[0])) if kind == "play" else "Waiting"
+            self.cpu_profiler.begin_play(self.num_plays, name)
+
         self.update_skipping_status()
 
         if not self.skip_animations:
-            self.file_writer.begin_animation()
+            cache_key = self.get_play_cache_key(*play_inputs)
+            if cache_key is not None and self.file_writer.use_cached_partial_movie(cache_key):
+                # Step through the play without drawing anything, rather than
+                # skipping it, so that the state it leaves behind is exact
+                self.playing_from_cache = True
+            else:
+                self.file_writer.begin_animation(cache_key)
 
         if self.window:
             self.virtual_animation_start_time = self.time
             self.real_animation_start_time = time.time()
 
     def post_play(self):
-        if not self.skip_animations:
+        if self.playing_from_cache:
+            self.playing_from_cache = False
+        elif not self.skip_animations:
             self.file_writer.end_animation()
 
         if self.preview_while_skipping and self.skip_animations and self.window is not None:
             # Show some quick frames along the way
             self.update_frame(dt=0, force_draw=True)
 
+        self.play_end_times.append(self.time)
         self.num_plays += 1
+        if self.cpu_profiler is not None:
+            self.cpu_profiler.end_play()
+            self.cpu_profiler.play_index = self.num_plays
 
     def begin_animations(self, animations: Iterable[Animation]) -> None:
         all_mobjects = set(self.get_mobject_family_members())
@@ -560,7 +696,8 @@ class Scene(object):
             for animation in animations:
                 animation.update_mobjects(dt)
                 alpha = t / animation.run_time
-                animation.interpolate(alpha)
+                with cpu_section("interpolate", animation):
+                    animation.interpolate(alpha)
             self.update_frame(dt)
             self.emit_frame()
 
@@ -587,7 +724,7 @@ class Scene(object):
         animations = list(map(prepare_animation, proto_animations))
         for anim in animations:
             anim.update_rate_info(run_time, rate_func, lag_ratio)
-        self.pre_play()
+        self.pre_play("play", animations)
         self.begin_animations(animations)
         self.progress_through_animations(animations)
         self.finish_animations(animations)
@@ -602,7 +739,7 @@ class Scene(object):
     ):
         if duration is None:
             duration = self.default_wait_time
-        self.pre_play()
+        self.pre_play("wait", duration, stop_condition)
         self.update_mobjects(dt=0)  # Any problems with this?
         if self.presenter_mode and not self.skip_animations and not ignore_presenter_mode:
             if note:
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import os
 import platform
+import queue
 import shutil
 import subprocess as sp
 import sys
+import threading
+import time
 
 import numpy as np
 from pydub import AudioSegment
@@ -13,15 +16,21 @@ from pathlib import Path
 
 from manimlib.logger import log
 from manimlib.mobject.mobject import Mobject
+from manimlib.scene.video_encoders import get_video_encoder_class
+from manimlib.utils.cache import set_cached_value
+from manimlib.utils.cpu_profiling import cpu_section
+from manimlib.utils.directories import get_partial_movie_cache_dir
 from manimlib.utils.file_ops import guarantee_existence
 from manimlib.utils.sounds import get_full_sound_file_path
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from typing import Callable
     from PIL.Image import Image
 
     from manimlib.camera.camera import Camera
+    from manimlib.scene.video_encoders import VideoEncoder
     from manimlib.scene.scene import Scene
 
 
@@ -41,13 +50,31 @@ class SceneFileWriter(object):
         show_file_location_upon_completion: bool = False,
         quiet: bool = False,
         total_frames: int = 0,
+        # If given, the number of frames written is recorded under this key
+        # on finishing, to serve as total_frames the next time around
+        frame_count_key: str | None = None,
         progress_description_len: int = 40,
         # Name of the binary used for ffmpeg
         ffmpeg_bin: str = "ffmpeg",
+        # Either "ffmpeg", to pipe frames into an ffmpeg process, or
+        # "pyav", to encode them in process with PyAV
+        video_encoder: str = "ffmpeg",
         video_codec: str = "libx264",
         pixel_format: str = "yuv420p",
         saturation: float = 1.0,
         gamma: float = 1.0,
+        # If positive, frames are handed to ffmpeg from a separate thread
+        # through a queue holding at most this many frames
+        frame_queue_depth: int = 0,
+        # Upper bound on the memory held by queued frames
+        frame_queue_max_mb: float = 512,
+        # If true, any sound is saved to a .wav file beside the
+        # movie, rather than being added to the movie itself
+        separate_audio_file: bool = False,
+        # If true, and output is subdivided, each partial movie is cached
+        # under a fingerprint of the play call producing it, and reused
+        # whenever a play call with the same fingerprint comes up again
+        cache_partial_movies: bool = False,
     ):
         self.scene: Scene = scene
         self.write_to_movie = write_to_movie
@@ -61,17 +88,29 @@ class SceneFileWriter(object):
         self.show_file_location_upon_completion = show_file_location_upon_completion
         self.quiet = quiet
         self.total_frames = total_frames
+        self.frame_count_key = frame_count_key
         self.progress_description_len = progress_description_len
         self.ffmpeg_bin = ffmpeg_bin
+        self.video_encoder = video_encoder
         self.video_codec = video_codec
         self.pixel_format = pixel_format
         self.saturation = saturation
         self.gamma = gamma
+        self.frame_queue_depth = frame_queue_depth
+        self.frame_queue_max_mb = frame_queue_max_mb
+        self.separate_audio_file = separate_audio_file
+        self.cache_partial_movies = cache_partial_movies
 
         # State during file writing
-        self.writing_process: sp.Popen | None = None
+        self.encoder: VideoEncoder | None = None
+        self.frame_writer: BackgroundFrameWriter | None = None
         self.progress_display: ProgressDisplay | None = None
         self.ended_with_interrupt: bool = False
+        self.partial_movie_cache_key: str | None = None
+        # Frames written into the main movie file, not counting inserts
+        self.n_frames_written: int = 0
+        self.writing_insert: bool = False
+        self.n_frames_expected: int = 0
 
         self.init_output_directories()
         self.init_audio()
@@ -125,6 +164,36 @@ class SceneFileWriter(object):
     def get_movie_file_path(self) -> str:
         return self.movie_file_path
 
+    def get_profile_trace_path(self) -> str:
+        return str(self.get_output_file_rootname()) + "_profile.json"
+
+    # Partial movie cache
+    def uses_partial_movie_cache(self) -> bool:
+        return self.cache_partial_movies and self.subdivide_output and self.write_to_movie
+
+    def get_cached_partial_movie_path(self, key: str) -> Path:
+        directory = guarantee_existence(get_partial_movie_cache_dir())
+        return Path(directory, key).with_suffix(self.movie_file_extension)
+
+    def use_cached_partial_movie(self, key: str) -> bool:
+        """
+        Copies the partial movie cached under key, if there is one, into
+        place for the next play, returning whether it was found
+        """
+        cached_path = self.get_cached_partial_movie_path(key)
+        if not cached_path.exists():
+            return False
+        shutil.copyfile(cached_path, self.get_next_partial_movie_path())
+        return True
+
+    def cache_partial_movie(self, key: str, file_path: str) -> None:
+        cached_path = self.get_cached_partial_movie_path(key)
+        # Copy then rename, so that an interrupted copy is never mistaken
+        # for a complete movie
+        temp_path = cached_path.with_name(cached_path.stem + "_temp" + cached_path.suffix)
+        shutil.copyfile(file_path, temp_path)
+        os.replace(temp_path, cached_path)
+
     # Sound
     def init_audio(self) -> None:
         self.includes_sound: bool = False
@@ -177,22 +246,32 @@ class SceneFileWriter(object):
     # Writers
     def begin(self) -> None:
         if not self.subdivide_output and self.write_to_movie:
+            self.n_frames_written = 0
             self.open_movie_pipe(self.get_movie_file_path())
 
-    def begin_animation(self) -> None:
+    def begin_animation(self, cache_key: str | None = None) -> None:
         if self.subdivide_output and self.write_to_movie:
+            self.partial_movie_cache_key = cache_key
             self.open_movie_pipe(self.get_next_partial_movie_path())
 
     def end_animation(self) -> None:
         if self.subdivide_output and self.write_to_movie:
             self.close_movie_pipe()
+            key = self.partial_movie_cache_key
+            if key is not None and not self.ended_with_interrupt:
+                self.cache_partial_movie(key, self.final_file_path)
+            self.partial_movie_cache_key = None
 
     def finish(self) -> None:
         if not self.subdivide_output and self.write_to_movie:
             self.close_movie_pipe()
-            if self.includes_sound:
+            if self.includes_sound and self.separate_audio_file:
+                self.save_audio_file()
+            elif self.includes_sound:
                 self.add_sound_to_video()
             self.print_file_ready_message(self.get_movie_file_path())
+            if self.frame_count_key is not None and not self.ended_with_interrupt:
+                set_cached_value(self.frame_count_key, self.n_frames_written)
         if self.save_last_frame:
             self.scene.update_frame(force_draw=True)
             self.save_final_image(self.scene.get_image())
@@ -207,29 +286,23 @@ class SceneFileWriter(object):
         fps = self.scene.camera.fps
         width, height = self.scene.camera.get_pixel_shape()
 
-        vf_arg = 'vflip'
-        vf_arg += f',eq=saturation={self.saturation}:gamma={self.gamma}'
-
-        command = [
-            self.ffmpeg_bin,
-            '-y',  # overwrite output file if it exists
-            '-f', 'rawvideo',
-            '-s', f'{width}x{height}',  # size of one frame
-            '-pix_fmt', 'rgba',
-            '-r', str(fps),  # frames per second
-            '-i', '-',  # The input comes from a pipe
-            '-vf', vf_arg,
-            '-an',  # Tells ffmpeg not to expect any audio
-            '-loglevel', 'error',
-        ]
-        if self.video_codec:
-            command += ['-vcodec', self.video_codec]
-        if self.pixel_format:
-            command += ['-pix_fmt', self.pixel_format]
-        command += [self.temp_file_path]
-        self.writing_process = sp.Popen(command, stdin=sp.PIPE)
+        encoder_class = get_video_encoder_class(self.video_encoder)
+        self.encoder = encoder_class(
+            self.temp_file_path,
+            width=width,
+            height=height,
+            fps=fps,
+            video_codec=self.video_codec,
+            pixel_format=self.pixel_format,
+            saturation=self.saturation,
+            gamma=self.gamma,
+            ffmpeg_bin=self.ffmpeg_bin,
+            input_pixel_format=self.scene.camera.readback_pixel_format,
+        )
+        self.init_frame_writer(self.scene.camera.get_raw_frame_nbytes())
 
         if not self.quiet:
+            self.n_frames_expected = 0
             self.progress_display = ProgressDisplay(
                 range(self.total_frames),
                 leave=False,
@@ -238,6 +311,17 @@ class SceneFileWriter(object):
             )
             self.set_progress_display_description()
 
+    def init_frame_writer(self, frame_size: int) -> None:
+        if self.frame_queue_depth <= 0:
+            self.frame_writer = None
+            return
+        max_bytes = self.frame_queue_max_mb * 1024 * 1024
+        max_frames = max(1, min(self.frame_queue_depth, int(max_bytes // frame_size)))
+        self.frame_writer = BackgroundFrameWriter(
+            self.encoder.write,
+            max_frames=max_frames,
+        )
+
     def use_fast_encoding(self):
         self.video_codec = "libx264rgb"
         self.pixel_format = "rgb32"
@@ -257,10 +341,12 @@ class SceneFileWriter(object):
         while (insert_path := self.get_insert_file_path(index)).exists():
             index += 1
         self.inserted_file_path = insert_path
+        self.writing_insert = True
         self.open_movie_pipe(self.inserted_file_path)
 
     def end_insert(self):
         self.close_movie_pipe()
+        self.writing_insert = False
         self.write_to_movie = False
         self.print_file_ready_message(self.inserted_file_path)
 
@@ -281,17 +367,59 @@ class SceneFileWriter(object):
             full_desc += " " * (desc_len - len(full_desc))
         self.progress_display.set_description(full_desc)
 
+    def expect_frames(self, n_frames: int) -> None:
+        """
+        Notes that some number of frames are about to be written, growing
+        the progress display's total to cover them if need be, for when
+        the total wasn't known in advance
+        """
+        if self.progress_display is None:
+            return
+        self.n_frames_expected += n_frames
+        if self.n_frames_expected > self.progress_display.total:
+            self.progress_display.total = self.n_frames_expected
+            self.progress_display.refresh()
+
     def write_frame(self, camera: Camera) -> None:
-        if self.write_to_movie:
-            raw_bytes = camera.get_raw_fbo_data()
-            self.writing_process.stdin.write(raw_bytes)
-            if self.progress_display is not None:
-                self.progress_display.update()
+        if not self.write_to_movie:
+            return
+        with cpu_section("readback", "Camera readback"):
+            if camera.uses_async_readback():
+                frames = list(camera.get_raw_fbo_data_async())
+            else:
+                frames = [camera.get_raw_frame_data()]
+        for raw_bytes in frames:
+            self.write_raw_frame(raw_bytes)
+
+    def write_raw_frame(self, raw_bytes: bytes) -> None:
+        with cpu_section("write_frame", "Write frame"):
+            if self.frame_writer is not None:
+                self.frame_writer.put(raw_bytes)
+            else:
+                self.encoder.write(raw_bytes)
+        if not self.writing_insert:
+            self.n_frames_written += 1
+        if self.progress_display is not None:
+            self.progress_display.update()
+
+    def flush_pending_frames(self) -> None:
+        # Frames read back asynchronously may still be in flight
+        for raw_bytes in self.scene.camera.flush_raw_fbo_data():
+            self.write_raw_frame(raw_bytes)
+
+    def close_frame_writer(self) -> None:
+        if self.frame_writer is None:
+            return
+        self.frame_writer.close()
+        if not self.quiet:
+            log.info(self.frame_writer.get_stats_message())
+        self.frame_writer = None
 
     def close_movie_pipe(self) -> None:
-        self.writing_process.stdin.close()
-        self.writing_process.wait()
-        self.writing_process.terminate()
+        self.flush_pending_frames()
+        self.close_frame_writer()
+        self.encoder.close()
+        self.encoder = None
         if self.progress_display is not None:
             self.progress_display.close()
 
@@ -300,36 +428,16 @@ class SceneFileWriter(object):
         else:
             self.movie_file_path = self.temp_file_path
 
+    def get_audio_file_path(self) -> str:
+        return os.path.splitext(self.get_movie_file_path())[0] + ".wav"
+
+    def save_audio_file(self) -> None:
+        self.audio_segment.export(self.get_audio_file_path(), format="wav")
+
     def add_sound_to_video(self) -> None:
-        movie_file_path = self.get_movie_file_path()
-        stem, ext = os.path.splitext(movie_file_path)
-        sound_file_path = stem + ".wav"
         # Makes sure sound file length will match video file
         self.add_audio_segment(AudioSegment.silent(0))
-        self.audio_segment.export(
-            sound_file_path,
-            bitrate='312k',
-        )
-        temp_file_path = stem + "_temp" + ext
-        commands = [
-            self.ffmpeg_bin,
-            "-i", movie_file_path,
-            "-i", sound_file_path,
-            '-y',  # overwrite output file if it exists
-            "-c:v", "copy",
-            "-c:a", "aac",
-            "-b:a", "320k",
-            # select video stream from first file
-            "-map", "0:v:0",
-            # select audio stream from second file
-            "-map", "1:a:0",
-            '-loglevel', 'error',
-            # "-shortest",
-            temp_file_path,
-        ]
-        sp.call(commands)
-        shutil.move(temp_file_path, movie_file_path)
-        os.remove(sound_file_path)
+        add_audio_to_movie(self.get_movie_file_path(), self.audio_segment, self.ffmpeg_bin)
 
     def save_final_image(self, image: Image) -> None:
         file_path = self.get_image_file_path()
@@ -383,3 +491,112 @@ class SceneFileWriter(object):
         if self.quiet:
             sys.stdout.close()
             sys.stdout = curr_stdout
+
+
+class BackgroundFrameWriter(object):
+    """
+    Passes raw frames to a write function on a dedicated thread, taking
+    them from a bounded queue. This way the render loop only blocks when
+    the encoder has fallen behind by more than the queue can hold.
+    """
+    def __init__(
+        self,
+        write_func: Callable[[bytes], object],
+        max_frames: int = 8,
+    ):
+        self.write_func = write_func
+        self.max_frames = max_frames
+        self.frame_queue: queue.Queue[bytes | None] = queue.Queue(maxsize=max_frames)
+        self.error: Exception | None = None
+
+        # Statistics
+        self.n_frames: int = 0
+        self.total_occupancy: int = 0
+        self.max_occupancy: int = 0
+        self.n_stalls: int = 0
+        self.stall_time: float = 0.0
+
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self) -> None:
+        while (raw_bytes := self.frame_queue.get()) is not None:
+            if self.error is not None:
+                # Keep draining so the render loop never blocks forever
+                continue
+            try:
+                self.write_func(raw_bytes)
+            except Exception as err:
+                self.error = err
+
+    def put(self, raw_bytes: bytes) -> None:
+        if self.error is not None:
+            raise self.error
+        occupancy = self.frame_queue.qsize()
+        self.n_frames += 1
+        self.total_occupancy += occupancy
+        self.max_occupancy = max(self.max_occupancy, occupancy)
+        if occupancy >= self.max_frames:
+            self.n_stalls += 1
+            start = time.perf_counter()
+            self.frame_queue.put(raw_bytes)
+            self.stall_time += time.perf_counter() - start
+        else:
+            self.frame_queue.put(raw_bytes)
+
+    def close(self) -> None:
+        self.frame_queue.put(None)
+        self.thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def get_stats(self) -> dict[str, float]:
+        return dict(
+            n_frames=self.n_frames,
+            max_frames=self.max_frames,
+            mean_occupancy=self.total_occupancy / max(self.n_frames, 1),
+            max_occupancy=self.max_occupancy,
+            n_stalls=self.n_stalls,
+            stall_time=self.stall_time,
+        )
+
+    def get_stats_message(self) -> str:
+        stats = self.get_stats()
+        return " ".join((
+            "Frame queue: mean occupancy {mean_occupancy:.1f}/{max_frames},",
+            "max {max_occupancy}, render loop stalled on",
+            "{n_stalls} of {n_frames} frames for {stall_time:.2f}s",
+        )).format(**stats)
+
+
+def add_audio_to_movie(
+    movie_file_path: str,
+    audio_segment: AudioSegment,
+    ffmpeg_bin: str = "ffmpeg",
+) -> None:
+    stem, ext = os.path.splitext(movie_file_path)
+    sound_file_path = stem + ".wav"
+    audio_segment.export(
+        sound_file_path,
+        bitrate='312k',
+    )
+    temp_file_path = stem + "_temp" + ext
+    commands = [
+        ffmpeg_bin,
+        "-i", movie_file_path,
+        "-i", sound_file_path,
+        '-y',  # overwrite output file if it exists
+        "-c:v", "copy",
+        "-c:a", "aac",
+        "-b:a", "320k",
+        # select video stream from first file
+        "-map", "0:v:0",
+        # select audio stream from second file
+        "-map", "1:a:0",
+        '-loglevel', 'error',
+        # "-shortest",
+        temp_file_path,
+    ]
+    sp.call(commands)
+    shutil.move(temp_file_path, movie_file_path)
+    os.remove(sound_file_path)
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import subprocess as sp
+from fractions import Fraction
+
+import numpy as np
+
+from manimlib.logger import log
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Type
+
+
+class VideoEncoder(object):
+    """
+    Takes in raw frames, as read from the camera's frame buffer, and
+    encodes them into a movie file.
+
+    Frames arrive either as tightly packed rgba bytes, with rows ordered
+    from the bottom of the image to the top, so that encoders are responsible
+    for flipping them vertically, or as planar yuv420p bytes which have
+    already been flipped on the GPU.
+    """
+    def __init__(
+        self,
+        file_path: str,
+        width: int,
+        height: int,
+        fps: int,
+        video_codec: str = "libx264",
+        pixel_format: str = "yuv420p",
+        saturation: float = 1.0,
+        gamma: float = 1.0,
+        ffmpeg_bin: str = "ffmpeg",
+        input_pixel_format: str = "rgba",
+    ):
+        self.file_path = file_path
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.video_codec = video_codec
+        self.pixel_format = pixel_format
+        self.saturation = saturation
+        self.gamma = gamma
+        self.ffmpeg_bin = ffmpeg_bin
+        self.input_pixel_format = input_pixel_format
+
+    def needs_flip(self) -> bool:
+        return self.input_pixel_format == "rgba"
+
+    def write(self, raw_bytes: bytes) -> None:
+        raise NotImplementedError()
+
+    def close(self) -> None:
+        raise NotImplementedError()
+
+
+class FFmpegPipeEncoder(VideoEncoder):
+    """
+    Pipes frames into a separate ffmpeg process
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        vf_arg = f'eq=saturation={self.saturation}:gamma={self.gamma}'
+        if self.needs_flip():
+            vf_arg = 'vflip,' + vf_arg
+
+        command = [
+            self.ffmpeg_bin,
+            '-y',  # overwrite output file if it exists
+            '-f', 'rawvideo',
+            '-s', f'{self.width}x{self.height}',  # size of one frame
+            '-pix_fmt', self.input_pixel_format,
+            '-r', str(self.fps),  # frames per second
+            '-i', '-',  # The input comes from a pipe
+            '-vf', vf_arg,
+            '-an',  # Tells ffmpeg not to expect any audio
+            '-loglevel', 'error',
+        ]
+        if self.video_codec:
+            command += ['-vcodec', self.video_codec]
+        if self.pixel_format:
+            command += ['-pix_fmt', self.pixel_format]
+        command += [self.file_path]
+        self.writing_process = sp.Popen(command, stdin=sp.PIPE)
+
+    def write(self, raw_bytes: bytes) -> None:
+        self.writing_process.stdin.write(raw_bytes)
+
+    def close(self) -> None:
+        self.writing_process.stdin.close()
+        self.writing_process.wait()
+        self.writing_process.terminate()
+
+
+class PyAVEncoder(VideoEncoder):
+    """
+    Encodes frames within this process using the libav bindings from
+    PyAV, which avoids copying each frame through a pipe.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        try:
+            import av
+        except ImportError:
+            raise ImportError(
+                "The pyav video encoder requires PyAV, which can be installed with `pip install av`"
+            )
+        self.av = av
+        if (self.saturation, self.gamma) != (1.0, 1.0):
+            log.warning("The pyav video encoder ignores the saturation and gamma settings")
+
+        self.container = av.open(self.file_path, mode="w")
+        codec = self.video_codec or self.container.default_video_codec
+        self.stream = self.container.add_stream(codec, rate=self.fps)
+        self.stream.width = self.width
+        self.stream.height = self.height
+        if self.pixel_format:
+            self.stream.pix_fmt = self.pixel_format
+        self.time_base = Fraction(1, self.fps)
+        self.n_frames_written = 0
+
+    def write(self, raw_bytes: bytes) -> None:
+        arr = np.frombuffer(raw_bytes, dtype=np.uint8)
+        if self.needs_flip():
+            # View onto the raw bytes, flipped so that the top row comes first
+            arr = arr.reshape((self.height, self.width, 4))[::-1]
+        else:
+            # Planes stacked as rows, as PyAV expects
+            arr = arr.reshape((3 * self.height // 2, self.width))
+        frame = self.av.VideoFrame.from_ndarray(arr, format=self.input_pixel_format)
+        frame.pts = self.n_frames_written
+        frame.time_base = self.time_base
+        self.n_frames_written += 1
+        self.container.mux(self.stream.encode(frame))
+
+    def close(self) -> None:
+        # Flush whatever the codec has buffered
+        self.container.mux(self.stream.encode(None))
+        self.container.close()
+
+
+VIDEO_ENCODERS: dict[str, Type[VideoEncoder]] = {
+    "ffmpeg": FFmpegPipeEncoder,
+    "pyav": PyAVEncoder,
+}
+
+
+def get_video_encoder_class(name: str) -> Type[VideoEncoder]:
+    if name not in VIDEO_ENCODERS:
+        raise ValueError(
+            f"Unrecognized video encoder \"{name}\", " + \
+            f"choose one of {', '.join(VIDEO_ENCODERS)}"
+        )
+    return VIDEO_ENCODERS[name]
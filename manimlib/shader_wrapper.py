@@ -11,8 +11,12 @@ from functools import lru_cache
 
 from manimlib.config import parse_cli
 from manimlib.config import manim_config
+from manimlib.utils.gpu_profiling import gpu_stage
 from manimlib.utils.shaders import get_shader_code_from_file
+from manimlib.utils.shaders import get_max_texture_units
 from manimlib.utils.shaders import get_shader_program
+from manimlib.utils.shaders import get_uniforms_key
+from manimlib.utils.shaders import get_vert_format
 from manimlib.utils.shaders import image_path_to_texture
 from manimlib.utils.shaders import set_program_uniform
 
@@ -30,6 +34,15 @@ if TYPE_CHECKING:
 # of a dict holding all the relevant information
 # to that shader
 
+# Program code, after any replacements, along with a hash of it, is shared
+# by all wrappers of the same type built from the same shader folder and
+# code replacements. These entries must be treated as read-only.
+PROGRAM_CODE_REGISTRY: dict[tuple, tuple[dict[str, str | None], int]] = dict()
+
+# Compiled programs, along with the vertex format of the attributes read
+# from them, are likewise shared by all wrappers with the same code hash
+PROGRAM_REGISTRY: dict[tuple, tuple] = dict()
+
 
 class ShaderWrapper(object):
     def __init__(
@@ -54,11 +67,11 @@ class ShaderWrapper(object):
         self.program_uniform_mirror: UniformDict = dict()
         self.bind_to_mobject_uniforms(mobject_uniforms or dict())
 
-        self.init_program_code()
-        for old, new in code_replacements.items():
-            self.replace_code(old, new)
+        self.init_shared_program_code(code_replacements)
         self.init_program()
         self.init_textures()
+        # Lengths of the arrays last read into the vbo, one for each submobject
+        self.segment_lengths: tuple[int, ...] | None = None
         self.init_vertex_objects()
         self.refresh_id()
 
@@ -68,6 +81,15 @@ class ShaderWrapper(object):
         # as an attribute should smoothly handle this case.
         return None
 
+    def init_shared_program_code(self, code_replacements: dict[str, str]) -> None:
+        key = (type(self), self.shader_folder, tuple(code_replacements.items()))
+        if key not in PROGRAM_CODE_REGISTRY:
+            self.init_program_code()
+            for old, new in code_replacements.items():
+                self.program_code = self.get_replaced_code(old, new)
+            PROGRAM_CODE_REGISTRY[key] = (self.program_code, self.get_code_hash())
+        self.program_code, self.code_hash = PROGRAM_CODE_REGISTRY[key]
+
     def init_program_code(self) -> None:
         def get_code(name: str) -> str | None:
             return get_shader_code_from_file(
@@ -86,8 +108,11 @@ class ShaderWrapper(object):
             self.vert_format = None
             self.programs = []
             return
-        self.program = get_shader_program(self.ctx, **self.program_code)
-        self.vert_format = moderngl.detect_format(self.program, self.vert_attributes)
+        key = (self.ctx, self.code_hash, self.vert_attributes)
+        if key not in PROGRAM_REGISTRY:
+            program = get_shader_program(self.ctx, **self.program_code)
+            PROGRAM_REGISTRY[key] = (program, get_vert_format(program, self.vert_attributes))
+        self.program, self.vert_format = PROGRAM_REGISTRY[key]
         self.programs = [self.program]
 
     def init_textures(self):
@@ -101,7 +126,7 @@ class ShaderWrapper(object):
         self.vaos = []
 
     def add_texture(self, name: str, texture: moderngl.Texture):
-        max_units = self.ctx.info['GL_MAX_TEXTURE_IMAGE_UNITS']
+        max_units = get_max_texture_units(self.ctx)
         if len(self.textures) >= max_units:
             raise ValueError(f"Unable to use more than {max_units} textures for a program")
         # The position in the list determines its id
@@ -114,21 +139,28 @@ class ShaderWrapper(object):
     def get_id(self) -> int:
         return self.id
 
+    def get_code_hash(self) -> int:
+        return hash("".join(map(str, self.program_code.values())))
+
     def refresh_id(self) -> None:
-        self.id = hash("".join(map(str, [
-            "".join(map(str, self.program_code.values())),
-            self.mobject_uniforms,
+        self.id = hash((
+            self.code_hash,
+            get_uniforms_key(self.mobject_uniforms),
             self.depth_test,
             self.render_primitive,
-            self.texture_paths,
-        ])))
+            tuple(self.texture_paths.items()),
+        ))
+
+    def get_replaced_code(self, old: str, new: str) -> dict[str, str | None]:
+        # Returns a new dict, since program_code may be shared with other wrappers
+        return {
+            name: None if code is None else re.sub(old, new, code)
+            for name, code in self.program_code.items()
+        }
 
     def replace_code(self, old: str, new: str) -> None:
-        code_map = self.program_code
-        for name in code_map:
-            if code_map[name] is None:
-                continue
-            code_map[name] = re.sub(old, new, code_map[name])
+        self.program_code = self.get_replaced_code(old, new)
+        self.code_hash = self.get_code_hash()
         self.init_program()
         self.refresh_id()
 
@@ -151,17 +183,29 @@ class ShaderWrapper(object):
     # Adding data
 
     def read_in(self, data_list: Iterable[np.ndarray]):
-        total_len = sum(map(len, data_list))
-        if total_len == 0:
+        data_list = list(data_list)
+        lengths = tuple(map(len, data_list))
+        if sum(lengths) == 0:
             if self.vbo is not None:
                 self.vbo.clear()
+            self.segment_lengths = None
             return
 
-        # If possible, read concatenated data into existing list
-        if len(self.vert_data) != total_len:
+        if self.vbo is None or lengths != self.segment_lengths:
+            self.rebuild_vbo(data_list, lengths)
+        else:
+            self.update_vbo(data_list)
+
+    def rebuild_vbo(self, data_list: list[np.ndarray], lengths: tuple[int, ...]):
+        total_len = sum(lengths)
+        # If possible, read concatenated data into existing list. The
+        # first time through, vert_data may still be the mobject's own
+        # data, so a fresh copy is made which update_vbo can compare against
+        if self.segment_lengths is None or len(self.vert_data) != total_len:
             self.vert_data = np.concatenate(data_list)
         else:
             np.concatenate(data_list, out=self.vert_data)
+        self.segment_lengths = lengths
 
         # Either create new vbo, or read data into it
         total_size = self.vert_data.itemsize * total_len
@@ -173,6 +217,32 @@ class ShaderWrapper(object):
         else:
             self.vbo.write(self.vert_data)
 
+    def update_vbo(self, data_list: list[np.ndarray]):
+        """
+        With the layout of the vbo unchanged, this compares each submobject's
+        data against what was last sent, and only writes the byte ranges
+        which differ, so that changing one part of a large family does not
+        require uploading the whole buffer again.
+        """
+        dirty_ranges: list[list[int]] = []
+        start = 0
+        for data, length in zip(data_list, self.segment_lengths):
+            end = start + length
+            old_data = self.vert_data[start:end]
+            new_data = np.ascontiguousarray(data)
+            if not np.array_equal(new_data.view(np.uint8), old_data.view(np.uint8)):
+                old_data[:] = new_data
+                # Merge with the previous range if they touch
+                if dirty_ranges and dirty_ranges[-1][1] == start:
+                    dirty_ranges[-1][1] = end
+                else:
+                    dirty_ranges.append([start, end])
+            start = end
+
+        itemsize = self.vert_data.itemsize
+        for start, end in dirty_ranges:
+            self.vbo.write(self.vert_data[start:end], offset=start * itemsize)
+
     def generate_vaos(self):
         # Vertex array object
         self.vaos = [
@@ -192,8 +262,11 @@ class ShaderWrapper(object):
             texture.use(tid)
 
     def render(self):
-        for vao in self.vaos:
-            vao.render()
+        if not self.vaos:
+            return
+        with gpu_stage(self.shader_folder):
+            for vao in self.vaos:
+                vao.render()
 
     def update_program_uniforms(self, camera_uniforms: UniformDict):
         for program in self.programs:
@@ -255,19 +328,46 @@ class VShaderWrapper(ShaderWrapper):
         }
 
     def init_program(self):
-        self.stroke_program = get_shader_program(
+        key = (self.ctx, self.code_hash)
+        if key not in PROGRAM_REGISTRY:
+            PROGRAM_REGISTRY[key] = self.get_programs()
+        self.programs = list(PROGRAM_REGISTRY[key])
+        self.stroke_program, self.fill_program, self.fill_border_program, self.fill_depth_program = self.programs
+
+        # Full vert format looks like this (total of 4x23 = 92 bytes):
+        # point 3
+        # stroke_rgba 4
+        # stroke_width 1
+        # joint_angle 1
+        # fill_rgba 4
+        # base_normal 3
+        # fill_border_width 1
+        self.stroke_vert_format = '3f 4f 1f 1f 16x 3f 4x'
+        self.stroke_vert_attributes = ['point', 'stroke_rgba', 'stroke_width', 'joint_angle', 'unit_normal']
+
+        self.fill_vert_format = '3f 24x 4f 3f 4x'
+        self.fill_vert_attributes = ['point', 'fill_rgba', 'base_normal']
+
+        self.fill_border_vert_format = '3f 20x 1f 4f 3f 1f'
+        self.fill_border_vert_attributes = ['point', 'joint_angle', 'stroke_rgba', 'unit_normal', 'stroke_width']
+
+        self.fill_depth_vert_format = '3f 40x 3f 4x'
+        self.fill_depth_vert_attributes = ['point', 'base_normal']
+
+    def get_programs(self) -> tuple[moderngl.Program, ...]:
+        stroke_program = get_shader_program(
             self.ctx,
             vertex_shader=self.program_code["stroke_vert"],
             geometry_shader=self.program_code["stroke_geom"],
             fragment_shader=self.program_code["stroke_frag"],
         )
-        self.fill_program = get_shader_program(
+        fill_program = get_shader_program(
             self.ctx,
             vertex_shader=self.program_code["fill_vert"],
             geometry_shader=self.program_code["fill_geom"],
             fragment_shader=self.program_code["fill_frag"],
         )
-        self.fill_border_program = get_shader_program(
+        fill_border_program = get_shader_program(
             self.ctx,
             vertex_shader=self.program_code["stroke_vert"],
             geometry_shader=self.program_code["stroke_geom"],
@@ -276,33 +376,13 @@ class VShaderWrapper(ShaderWrapper):
                 "frag_color.a *= 0.95; frag_color.rgb *= frag_color.a;",
             )
         )
-        self.fill_depth_program = get_shader_program(
+        fill_depth_program = get_shader_program(
             self.ctx,
             vertex_shader=self.program_code["depth_vert"],
             geometry_shader=self.program_code["depth_geom"],
             fragment_shader=self.program_code["depth_frag"],
         )
-        self.programs = [self.stroke_program, self.fill_program, self.fill_border_program, self.fill_depth_program]
-
-        # Full vert format looks like this (total of 4x23 = 92 bytes):
-        # point 3
-        # stroke_rgba 4
-        # stroke_width 1
-        # joint_angle 1
-        # fill_rgba 4
-        # base_normal 3
-        # fill_border_width 1
-        self.stroke_vert_format = '3f 4f 1f 1f 16x 3f 4x'
-        self.stroke_vert_attributes = ['point', 'stroke_rgba', 'stroke_width', 'joint_angle', 'unit_normal']
-
-        self.fill_vert_format = '3f 24x 4f 3f 4x'
-        self.fill_vert_attributes = ['point', 'fill_rgba', 'base_normal']
-
-        self.fill_border_vert_format = '3f 20x 1f 4f 3f 1f'
-        self.fill_border_vert_attributes = ['point', 'joint_angle', 'stroke_rgba', 'unit_normal', 'stroke_width']
-
-        self.fill_depth_vert_format = '3f 40x 3f 4x'
-        self.fill_depth_vert_attributes = ['point', 'base_normal']
+        return (stroke_program, fill_program, fill_border_program, fill_depth_program)
 
     def init_vertex_objects(self):
         self.vbo = None
@@ -339,13 +419,14 @@ class VShaderWrapper(ShaderWrapper):
 
     def refresh_id(self):
         super().refresh_id()
-        self.id = hash(str(self.id) + str(self.stroke_behind))
+        self.id = hash((self.id, self.stroke_behind))
 
     # Rendering
     def render_stroke(self):
         if self.stroke_vao is None:
             return
-        self.stroke_vao.render()
+        with gpu_stage("stroke"):
+            self.stroke_vao.render()
 
     def render_fill(self):
         if self.fill_vao is None:
@@ -356,7 +437,8 @@ class VShaderWrapper(ShaderWrapper):
 
         # Render to a separate texture, due to strange alpha compositing
         # for the blended winding calculation
-        fill_tx_fbo.clear()
+        with gpu_stage("fill_clear"):
+            fill_tx_fbo.clear()
         fill_tx_fbo.use()
 
         # Be sure not to apply depth test while rendering fill
@@ -371,27 +453,32 @@ class VShaderWrapper(ShaderWrapper):
             gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA,
             gl.GL_ONE_MINUS_DST_ALPHA, gl.GL_ONE
         )
-        self.fill_vao.render()
+        with gpu_stage("fill"):
+            self.fill_vao.render()
 
         if apply_depth_test:
             self.ctx.enable(moderngl.DEPTH_TEST)
-            depth_tx_fbo.clear(1.0)
+            with gpu_stage("fill_clear"):
+                depth_tx_fbo.clear(1.0)
             depth_tx_fbo.use()
             gl.glBlendFunc(gl.GL_ONE, gl.GL_ONE)
             gl.glBlendEquation(gl.GL_MIN)
-            self.fill_depth_vao.render()
+            with gpu_stage("fill_depth"):
+                self.fill_depth_vao.render()
 
         # Now add border, just taking the max alpha
         gl.glBlendFunc(gl.GL_ONE, gl.GL_ONE)
         gl.glBlendEquation(gl.GL_MAX)
-        self.fill_border_vao.render()
+        with gpu_stage("fill_border"):
+            self.fill_border_vao.render()
 
         # Take the texture we were just drawing to, and render it to
         # the main scene. Account for how alphas have been premultiplied
         original_fbo.use()
         gl.glBlendFunc(gl.GL_ONE, gl.GL_ONE_MINUS_SRC_ALPHA)
         gl.glBlendEquation(gl.GL_FUNC_ADD)
-        fill_tx_vao.render()
+        with gpu_stage("fill_composite"):
+            fill_tx_vao.render()
 
         # Return to original blending state
         gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
@@ -0,0 +1,14 @@
+#ifndef CAMERA_UNIFORMS
+#define CAMERA_UNIFORMS
+// Camera state shared by every program through one uniform buffer,
+// which the camera writes once per frame. Members are ordered so that
+// each vec3 is padded out by the float after it under std140.
+layout(std140) uniform CameraUniforms {
+    mat4 view;
+    vec3 frame_rescale_factors;
+    float frame_scale;
+    vec3 camera_position;
+    float pixel_size;
+    vec3 light_position;
+};
+#endif
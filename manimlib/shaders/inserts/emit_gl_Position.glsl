@@ -1,7 +1,7 @@
+#INSERT camera_uniforms.glsl
+
 uniform float is_fixed_in_frame;
-uniform mat4 view;
 uniform float focal_distance;
-uniform vec3 frame_rescale_factors;
 uniform vec4 clip_plane;
 
 void emit_gl_Position(vec3 point){
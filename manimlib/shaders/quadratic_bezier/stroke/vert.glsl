@@ -1,6 +1,7 @@
 #version 330
 
-uniform float frame_scale;
+#INSERT camera_uniforms.glsl
+
 uniform float is_fixed_in_frame;
 uniform float scale_stroke_with_zoom;
 
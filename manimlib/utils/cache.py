@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from collections import OrderedDict
 from diskcache import Cache
 from contextlib import contextmanager
 from functools import wraps
@@ -11,6 +12,7 @@ from manimlib.utils.simple_functions import hash_string
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from typing import Any, Callable, Hashable, TypeVar
     T = TypeVar('T')
 
 
@@ -21,7 +23,7 @@ _cache = Cache(get_cache_dir(), size_limit=CACHE_SIZE)
 def cache_on_disk(func: Callable[..., T]) -> Callable[..., T]:
     @wraps(func)
     def wrapper(*args, **kwargs):
-        key = hash_string(f"{func.__name__}{args}{kwargs}")
+        key = get_cache_key(func, *args, **kwargs)
         value = _cache.get(key)
         if value is None:
             value = func(*args, **kwargs)
@@ -30,5 +32,93 @@ def cache_on_disk(func: Callable[..., T]) -> Callable[..., T]:
     return wrapper
 
 
+def get_cache_key(func: Callable, *args, **kwargs) -> str:
+    """
+    Returns the key under which cache_on_disk stores the result of
+    calling func with the given arguments
+    """
+    return hash_string(f"{func.__name__}{args}{kwargs}")
+
+
+def get_cached_value(key: str, default: Any = None) -> Any:
+    return _cache.get(key, default)
+
+
+def set_cached_value(key: str, value: Any) -> None:
+    _cache.set(key, value)
+
+
 def clear_cache():
     _cache.clear()
+
+
+class LRUCache(object):
+    """
+    In-memory map which holds values up to a total size of max_bytes, as
+    measured by get_size, dropping those least recently used to make room.
+    Counts of hits, misses and evictions are kept for tuning max_bytes.
+    """
+    def __init__(self, max_bytes: int, get_size: Callable[[Any], int]):
+        self.max_bytes = max_bytes
+        self.get_size = get_size
+        self.entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry[0]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self.pop(key)
+        size = self.get_size(value)
+        if size > self.max_bytes:
+            return
+        self.entries[key] = (value, size)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            old_key, (old_value, old_size) = self.entries.popitem(last=False)
+            self.total_bytes -= old_size
+            self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        if key not in self.entries:
+            return default
+        value, size = self.entries.pop(key)
+        self.total_bytes -= size
+        return value
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.total_bytes = 0
+
+    def get_stats(self) -> dict[str, int]:
+        return dict(
+            entries=len(self.entries),
+            total_bytes=self.total_bytes,
+            max_bytes=self.max_bytes,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+        )
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.entries
+
+    def __getitem__(self, key: Hashable) -> Any:
+        if key not in self.entries:
+            raise KeyError(key)
+        return self.get(key)
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.set(key, value)
+
+    def __len__(self) -> int:
+        return len(self.entries)
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextlib import nullcontext
+import json
+import os
+import threading
+import time
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, ContextManager, Iterator, Optional
+
+
+class CPUProfiler(object):
+    """
+    Measures the wall time spent in each section of the work of rendering a
+    scene, such as individual updaters, the interpolation of each animation,
+    capturing frames, reading them back and writing them out.  Times are
+    aggregated by section and by the index of the play or wait call during
+    which they happened, and every timed section is also kept as an event
+    for a trace file in the Chrome trace format, which can be opened with
+    chrome://tracing or https://ui.perfetto.dev.
+    """
+    def __init__(self):
+        self.start_ns = time.perf_counter_ns()
+        self.play_index: int = 0
+        self.play_names: dict[int, str] = dict()
+        self.play_start_ns: Optional[int] = None
+        # Maps (play index, category, name) to [total nanoseconds, number of calls]
+        self.totals: dict[tuple[int, str, str], list[int]] = dict()
+        # Sections may be nested, e.g. updaters run within an animation, so
+        # overall times, by play index, count only the outermost sections
+        self.depth: int = 0
+        self.top_level_totals: dict[int, int] = dict()
+        self.trace_events: list[dict[str, Any]] = []
+        # Names of the functions being timed, by their code
+        self.function_names: dict[Any, str] = dict()
+
+    def begin_play(self, index: int, name: str) -> None:
+        self.play_index = index
+        self.play_names.setdefault(index, name)
+        self.play_start_ns = time.perf_counter_ns()
+
+    def end_play(self) -> None:
+        if self.play_start_ns is None:
+            return
+        self.add_trace_event("play", self.play_names[self.play_index], self.play_start_ns, time.perf_counter_ns())
+        self.play_start_ns = None
+
+    @contextmanager
+    def time_section(self, category: str, obj: Any) -> Iterator[None]:
+        start = time.perf_counter_ns()
+        self.depth += 1
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            self.depth -= 1
+            name = self.get_name(obj)
+            totals = self.totals.setdefault((self.play_index, category, name), [0, 0])
+            totals[0] += end - start
+            totals[1] += 1
+            if self.depth == 0:
+                index = self.play_index
+                self.top_level_totals[index] = self.top_level_totals.get(index, 0) + end - start
+            self.add_trace_event(category, name, start, end)
+
+    def get_name(self, obj: Any) -> str:
+        if isinstance(obj, str):
+            return obj
+        func = getattr(obj, "__func__", obj)
+        code = getattr(func, "__code__", None)
+        if code is None:
+            return str(obj)
+        if code not in self.function_names:
+            self.function_names[code] = "{} ({}:{})".format(
+                getattr(func, "__qualname__", code.co_name),
+                os.path.basename(code.co_filename),
+                code.co_firstlineno,
+            )
+        return self.function_names[code]
+
+    def add_trace_event(self, category: str, name: str, start_ns: int, end_ns: int) -> None:
+        self.trace_events.append(dict(
+            name=name,
+            cat=category,
+            ph="X",
+            ts=(start_ns - self.start_ns) / 1000,
+            dur=(end_ns - start_ns) / 1000,
+            pid=os.getpid(),
+            tid=threading.get_ident(),
+            args=dict(play=self.play_index),
+        ))
+
+    def get_report(self, max_rows: int = 40) -> str:
+        if not self.totals:
+            return "No CPU work was timed"
+
+        grand_total = sum(self.top_level_totals.values())
+        by_play = self.top_level_totals
+        by_category: dict[str, int] = dict()
+        by_section: dict[tuple[str, str], list[int]] = dict()
+        for (index, category, name), (total, count) in self.totals.items():
+            by_category[category] = by_category.get(category, 0) + total
+            section = by_section.setdefault((category, name), [0, 0])
+            section[0] += total
+            section[1] += count
+
+        def percent(ns: int) -> str:
+            return f"{100 * ns / max(grand_total, 1):5.1f}%"
+
+        def row(name: str, ns: int, count: int | None = None) -> str:
+            result = f"  {name:<60} {ns / 1e6:9.2f} ms {percent(ns)}"
+            if count is not None:
+                result += f" {count:6d} calls"
+            return result
+
+        def play_name(index: int) -> str:
+            return f"{index} {self.play_names.get(index, '')}".strip()[:60]
+
+        lines = [f"CPU time: {grand_total / 1e6:.1f} ms in timed sections"]
+        lines.append("Times of sections include those of sections nested within them")
+        lines.append("By category:")
+        for category, total in sorted(by_category.items(), key=lambda p: -p[1]):
+            lines.append(row(category, total))
+        lines.append("By play:")
+        for index, total in sorted(by_play.items(), key=lambda p: -p[1])[:max_rows]:
+            lines.append(row(play_name(index), total))
+        lines.append("By section:")
+        for (category, name), (total, count) in sorted(by_section.items(), key=lambda p: -p[1][0])[:max_rows]:
+            lines.append(row(f"{category} / {name}", total, count))
+        lines.append("By play and section:")
+        for (index, category, name), (total, count) in sorted(self.totals.items(), key=lambda p: -p[1][0])[:max_rows]:
+            lines.append(row(f"{index} / {category} / {name}", total, count))
+        return "\n".join(lines)
+
+    def write_trace(self, file_path: str) -> None:
+        with open(file_path, "w") as fp:
+            json.dump(dict(traceEvents=self.trace_events, displayTimeUnit="ms"), fp)
+
+
+# Profiler which cpu_section reports to, if any
+ACTIVE_PROFILER: Optional[CPUProfiler] = None
+
+
+def set_active_cpu_profiler(profiler: Optional[CPUProfiler]) -> None:
+    global ACTIVE_PROFILER
+    ACTIVE_PROFILER = profiler
+
+
+def cpu_section(category: str, obj: Any) -> ContextManager:
+    """
+    Times the enclosed work as the given category, under the name of obj,
+    which may be a string, a function or anything else with a sensible
+    string form, when a profiler is active, and otherwise does nothing
+    """
+    if ACTIVE_PROFILER is None:
+        return nullcontext()
+    return ACTIVE_PROFILER.time_section(category, obj)
@@ -18,6 +18,10 @@ def get_cache_dir() -> str:
     return get_directories()["cache"] or appdirs.user_cache_dir("manim")
 
 
+def get_partial_movie_cache_dir() -> str:
+    return os.path.join(get_cache_dir(), "partial_movies")
+
+
 def get_temp_dir() -> str:
     return get_directories()["temporary_storage"] or tempfile.gettempdir()
 
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import hashlib
+import types
+
+import numpy as np
+
+from manimlib.mobject.mobject import Mobject
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+class Fingerprint(object):
+    """
+    Builds a digest of the state of arbitrary python objects, like mobjects,
+    animations, and the functions passed into them, for recognizing when
+    the same inputs come up again, e.g. from one run of a scene to the next.
+
+    Mobjects are summarized by the shader data and uniforms of their family,
+    along with their simpler public attributes and updaters.  Using shader
+    data means derived values, like joint angles, are brought up to date just
+    as they would be on rendering, so that a mobject gets the same summary
+    whether or not it has been drawn. Functions are summarized by
+    their code, defaults and closures, and other objects by their attributes.
+    Anything which can't be summarized by value falls back on its repr,
+    which for most objects includes a memory address, so that at worst two
+    fingerprints will fail to match when they could have.
+    """
+    # Attributes of mobjects which are either covered elsewhere, or
+    # don't bear on what will be rendered
+    ignored_mobject_keys = {
+        "data", "uniforms", "submobjects", "parents", "family", "updaters",
+        "shader_wrapper", "shader_wrappers", "saved_state", "target",
+        "bounding_box", "event_listners",
+    }
+
+    def __init__(self):
+        self.hasher = hashlib.sha256()
+        # Maps ids of objects already included to their order of inclusion,
+        # which both handles cycles and keeps a reference to each object so
+        # that ids aren't reused while the fingerprint is being built
+        self.memo: dict[int, tuple[int, Any]] = dict()
+
+    def hexdigest(self, n_bytes: int = 32) -> str:
+        return self.hasher.hexdigest()[:n_bytes]
+
+    def add_token(self, *tokens: str | bytes) -> None:
+        for token in tokens:
+            if isinstance(token, str):
+                token = token.encode()
+            self.hasher.update(len(token).to_bytes(8, "little"))
+            self.hasher.update(token)
+
+    def add_reference(self, obj: Any, name: str) -> Fingerprint:
+        """
+        Includes an object by name alone, so that wherever else it turns
+        up, say in the closure of some updater, it's not summarized by value.
+        This is for objects whose relevant state is accounted for separately.
+        """
+        self.memo[id(obj)] = (len(self.memo), obj)
+        self.add_token("named", name)
+        return self
+
+    def add(self, obj: Any) -> Fingerprint:
+        if obj is None or isinstance(obj, (bool, int, float, complex, str)):
+            self.add_token(type(obj).__name__, repr(obj))
+        elif isinstance(obj, bytes):
+            self.add_token("bytes", obj)
+        elif isinstance(obj, (np.ndarray, np.generic)):
+            arr = np.asarray(obj)
+            self.add_token("ndarray", arr.dtype.str, repr(arr.shape))
+            if arr.dtype.hasobject:
+                for item in arr.flat:
+                    self.add(item)
+            else:
+                self.add_token(np.ascontiguousarray(arr).tobytes())
+        elif id(obj) in self.memo:
+            self.add_token("ref", str(self.memo[id(obj)][0]))
+        else:
+            self.memo[id(obj)] = (len(self.memo), obj)
+            self.add_new_object(obj)
+        return self
+
+    def add_new_object(self, obj: Any) -> None:
+        if isinstance(obj, (list, tuple, set, frozenset)):
+            self.add_token(type(obj).__name__, str(len(obj)))
+            items = sorted(obj, key=repr) if isinstance(obj, (set, frozenset)) else obj
+            for item in items:
+                self.add(item)
+        elif isinstance(obj, dict):
+            self.add_token("dict", str(len(obj)))
+            for key, value in obj.items():
+                self.add(key)
+                self.add(value)
+        elif isinstance(obj, Mobject):
+            self.add_mobject(obj)
+        elif isinstance(obj, types.MethodType):
+            self.add_token("method")
+            self.add(obj.__func__)
+            self.add(obj.__self__)
+        elif isinstance(obj, types.FunctionType):
+            self.add_function(obj)
+        elif isinstance(obj, types.CodeType):
+            self.add_token("code", obj.co_name, obj.co_code)
+            self.add(obj.co_consts)
+            self.add(obj.co_names)
+        elif isinstance(obj, (type, types.ModuleType, types.BuiltinFunctionType)):
+            name = getattr(obj, "__qualname__", obj.__name__)
+            self.add_token(type(obj).__name__, getattr(obj, "__module__", None) or "", name)
+        elif hasattr(obj, "__dict__"):
+            self.add_token("object", type(obj).__module__, type(obj).__qualname__)
+            self.add(vars(obj))
+        else:
+            self.add_token("repr", repr(obj))
+
+    def add_function(self, func: types.FunctionType) -> None:
+        self.add_token("function", func.__module__ or "", func.__qualname__)
+        self.add(func.__code__)
+        self.add(func.__defaults__)
+        self.add(func.__kwdefaults__)
+        if func.__closure__:
+            for cell in func.__closure__:
+                try:
+                    self.add(cell.cell_contents)
+                except ValueError:
+                    # Empty cell
+                    self.add_token("empty")
+
+    def add_mobject(self, mobject: Mobject) -> None:
+        self.add_token("mobject", type(mobject).__module__, type(mobject).__qualname__)
+        for mob in mobject.get_family():
+            self.add_token(type(mob).__qualname__, str(len(mob.submobjects)))
+            self.add(mob.get_shader_data() if mob.has_points() else mob.data)
+            self.add(mob.uniforms)
+            self.add(mob.updaters)
+            for key, value in vars(mob).items():
+                if key.startswith("_") or key in self.ignored_mobject_keys:
+                    continue
+                if value is None or isinstance(value, (bool, int, float, str, tuple, dict, np.ndarray)):
+                    self.add(key)
+                    self.add(value)
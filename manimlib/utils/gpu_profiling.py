@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextlib import nullcontext
+
+import moderngl
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import ContextManager, Iterator, Optional
+
+
+class GPUProfiler(object):
+    """
+    Measures how long the GPU spends on each stage of rendering, such as
+    drawing strokes, the passes which make up a fill, or reading frames back,
+    using timer queries. Times are aggregated by stage, and by the class of
+    mobject being drawn at the time.
+
+    Timer queries cannot be nested, so stages should be the innermost
+    pieces of work. Results are fetched in batches, rather than right after
+    each stage, to avoid stalling on the GPU more than necessary.
+    """
+    def __init__(self, ctx: moderngl.Context, max_pending: int = 256):
+        self.ctx = ctx
+        self.max_pending = max_pending
+        self.label: str = "Other"
+        self.free_queries: list[moderngl.Query] = []
+        self.pending: list[tuple[tuple[str, str], moderngl.Query]] = []
+        # Maps (label, stage) to [total nanoseconds, number of calls]
+        self.totals: dict[tuple[str, str], list[int]] = dict()
+
+    @contextmanager
+    def time_stage(self, stage: str) -> Iterator[None]:
+        if self.free_queries:
+            query = self.free_queries.pop()
+        else:
+            query = self.ctx.query(time=True)
+        with query:
+            yield
+        self.pending.append(((self.label, stage), query))
+        if len(self.pending) >= self.max_pending:
+            self.resolve_pending()
+
+    def resolve_pending(self) -> None:
+        for key, query in self.pending:
+            totals = self.totals.setdefault(key, [0, 0])
+            totals[0] += query.elapsed
+            totals[1] += 1
+            self.free_queries.append(query)
+        self.pending = []
+
+    def get_report(self) -> str:
+        self.resolve_pending()
+        if not self.totals:
+            return "No GPU work was timed"
+
+        grand_total = sum(total for total, count in self.totals.values())
+        by_label: dict[str, int] = dict()
+        by_stage: dict[str, int] = dict()
+        for (label, stage), (total, count) in self.totals.items():
+            by_label[label] = by_label.get(label, 0) + total
+            by_stage[stage] = by_stage.get(stage, 0) + total
+
+        def percent(ns: int) -> str:
+            return f"{100 * ns / max(grand_total, 1):5.1f}%"
+
+        def row(name: str, ns: int, count: int | None = None) -> str:
+            result = f"  {name:<32} {ns / 1e6:9.2f} ms {percent(ns)}"
+            if count is not None:
+                result += f" {count:6d} calls"
+            return result
+
+        lines = [f"GPU time: {grand_total / 1e6:.1f} ms in total"]
+        lines.append("By mobject class:")
+        for label, total in sorted(by_label.items(), key=lambda p: -p[1]):
+            lines.append(row(label, total))
+        lines.append("By stage:")
+        for stage, total in sorted(by_stage.items(), key=lambda p: -p[1]):
+            lines.append(row(stage, total))
+        lines.append("By mobject class and stage:")
+        for (label, stage), (total, count) in sorted(self.totals.items(), key=lambda p: -p[1][0]):
+            lines.append(row(f"{label} / {stage}", total, count))
+        return "\n".join(lines)
+
+    def release(self) -> None:
+        # Waits on pending queries, which makes every query free to release
+        self.resolve_pending()
+        for query in self.free_queries:
+            # Older versions of moderngl offer no way to release a query
+            if hasattr(query, "release"):
+                query.release()
+        self.free_queries = []
+
+
+# Profiler which gpu_stage reports to, if any
+ACTIVE_PROFILER: Optional[GPUProfiler] = None
+
+
+def set_active_gpu_profiler(profiler: Optional[GPUProfiler]) -> None:
+    global ACTIVE_PROFILER
+    ACTIVE_PROFILER = profiler
+
+
+def gpu_stage(stage: str) -> ContextManager:
+    """
+    Times the enclosed GPU work under the given stage name when a
+    profiler is active, and otherwise does nothing
+    """
+    if ACTIVE_PROFILER is None:
+        return nullcontext()
+    return ACTIVE_PROFILER.time_stage(stage)
+
+
+def set_gpu_stage_label(label: str) -> None:
+    """
+    Attributes subsequently timed stages to the given label
+    """
+    if ACTIVE_PROFILER is not None:
+        ACTIVE_PROFILER.label = label
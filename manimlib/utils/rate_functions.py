@@ -9,6 +9,15 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from typing import Callable
 
+    from manimlib.typing import FloatArray
+
+# Each of these functions accepts either a single float or a numpy
+# array of them, returning values of the same shape.  Where they branch,
+# they use np.where, with [()] turning the zero-dimensional arrays this
+# produces for a single float back into a scalar.  Powers of arrays may
+# differ from those of single floats in the last bit, so results for an
+# array can differ from entry-by-entry results by as much.
+
 
 def linear(t: float) -> float:
     return t
@@ -34,25 +43,25 @@ def slow_into(t: float) -> float:
 
 
 def double_smooth(t: float) -> float:
-    if t < 0.5:
-        return 0.5 * smooth(2 * t)
-    else:
-        return 0.5 * (1 + smooth(2 * t - 1))
+    return np.where(
+        t < 0.5,
+        0.5 * smooth(2 * t),
+        0.5 * (1 + smooth(2 * t - 1)),
+    )[()]
 
 
 def there_and_back(t: float) -> float:
-    new_t = 2 * t if t < 0.5 else 2 * (1 - t)
+    new_t = np.where(t < 0.5, 2 * t, 2 * (1 - t))[()]
     return smooth(new_t)
 
 
 def there_and_back_with_pause(t: float, pause_ratio: float = 1. / 3) -> float:
     a = 2. / (1. - pause_ratio)
-    if t < 0.5 - pause_ratio / 2:
-        return smooth(a * t)
-    elif t < 0.5 + pause_ratio / 2:
-        return 1
-    else:
-        return smooth(a - a * t)
+    return np.where(
+        t < 0.5 - pause_ratio / 2,
+        smooth(a * t),
+        np.where(t < 0.5 + pause_ratio / 2, 1, smooth(a - a * t)),
+    )[()]
 
 
 def running_start(t: float, pull_factor: float = -0.5) -> float:
@@ -83,13 +92,8 @@ def squish_rate_func(
 ) -> Callable[[float], float]:
     def result(t):
         if a == b:
-            return a
-        elif t < a:
-            return func(0)
-        elif t > b:
-            return func(1)
-        else:
-            return func((t - a) / (b - a))
+            return a + 0 * t
+        return func(np.clip((t - a) / (b - a), 0, 1))
 
     return result
 
@@ -107,3 +111,20 @@ def exponential_decay(t: float, half_life: float = 0.1) -> float:
     # The half-life should be rather small to minimize
     # the cut-off error at the end
     return 1 - np.exp(-t / half_life)
+
+
+def rate_func_on_array(
+    func: Callable[[float], float],
+    t: FloatArray
+) -> FloatArray:
+    """
+    Evaluates func on every entry of t, in one call when func handles
+    arrays, as all the functions above do, and otherwise one entry at a time
+    """
+    try:
+        result = np.asarray(func(t), dtype=np.float64)
+    except (TypeError, ValueError):
+        result = None
+    if result is None or result.shape != t.shape:
+        result = np.fromiter(map(func, t.tolist()), dtype=np.float64, count=len(t))
+    return result
@@ -16,8 +16,10 @@ if TYPE_CHECKING:
     from typing import Sequence, Optional
 
 
-# Global maps to reflect uniform status
-PROGRAM_UNIFORM_MIRRORS: dict[int, dict[str, float | tuple]] = dict()
+# Name of the uniform block declared in shaders/inserts/camera_uniforms.glsl,
+# and the binding point through which the camera's buffer is attached to it
+CAMERA_UNIFORM_BLOCK = "CameraUniforms"
+CAMERA_UNIFORM_BINDING = 0
 
 
 @lru_cache()
@@ -37,11 +39,37 @@ def get_shader_program(
         fragment_shader: Optional[str] = None,
         geometry_shader: Optional[str] = None,
 ) -> moderngl.Program:
-    return ctx.program(
+    program = ctx.program(
         vertex_shader=vertex_shader,
         fragment_shader=fragment_shader,
         geometry_shader=geometry_shader,
     )
+    camera_block = program.get(CAMERA_UNIFORM_BLOCK, None)
+    if camera_block is not None:
+        camera_block.binding = CAMERA_UNIFORM_BINDING
+    return program
+
+
+@lru_cache()
+def get_vert_format(program: moderngl.Program, attributes: tuple[str, ...]) -> str:
+    return moderngl.detect_format(program, attributes)
+
+
+@lru_cache()
+def get_max_texture_units(ctx: moderngl.Context) -> int:
+    # ctx.info queries the whole driver state, so is worth only doing once
+    return ctx.info['GL_MAX_TEXTURE_IMAGE_UNITS']
+
+
+def get_uniforms_key(uniforms: dict[str, float | tuple | np.ndarray]) -> tuple:
+    """
+    A hashable summary of a dictionary of uniforms, for deciding
+    which mobjects can share a draw call
+    """
+    return tuple(
+        (name, value.tobytes() if isinstance(value, np.ndarray) else value)
+        for name, value in uniforms.items()
+    )
 
 
 def set_program_uniform(
@@ -55,13 +83,14 @@ def set_program_uniform(
     doesn't needlessly reset it, requiring an exchange with gpu
     memory, if it sees the same value again.
 
+    The dictionary lives on the program's extra attribute, so it
+    goes away along with the program.
+
     Returns True if changed the program, False if it left it as is.
     """
-
-    pid = id(program)
-    if pid not in PROGRAM_UNIFORM_MIRRORS:
-        PROGRAM_UNIFORM_MIRRORS[pid] = dict()
-    uniform_mirror = PROGRAM_UNIFORM_MIRRORS[pid]
+    if program.extra is None:
+        program.extra = dict()
+    uniform_mirror = program.extra
 
     if type(value) is np.ndarray and value.ndim > 0:
         value = tuple(value.flatten())
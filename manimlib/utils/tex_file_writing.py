@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+import math
 import os
 import re
 import yaml
@@ -10,11 +12,24 @@ from pathlib import Path
 import tempfile
 
 from manimlib.utils.cache import cache_on_disk
+from manimlib.utils.cache import get_cache_key
+from manimlib.utils.cache import get_cached_value
+from manimlib.utils.cache import set_cached_value
 from manimlib.config import manim_config
 from manimlib.config import get_manim_dir
 from manimlib.logger import log
 from manimlib.utils.simple_functions import hash_string
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Iterable, Sequence
+
+
+# Batches of LaTeX are only split into documents of at least this many
+# strings, since each document pays for starting latex and dvisvgm
+# and loading fonts
+MIN_STRINGS_PER_DOCUMENT = 8
 
 def get_tex_template_config(template_name: str) -> dict[str, str]:
     name = template_name.replace(" ", "_").lower()
@@ -47,6 +62,32 @@ def get_full_tex(content: str, preamble: str = ""):
     )) + "\n"
 
 
+def get_compiler_and_preamble(template: str = "", additional_preamble: str = "") -> tuple[str, str]:
+    compiler, preamble = get_tex_config(template)
+    return compiler, "\n".join([preamble, additional_preamble])
+
+
+def get_full_tex_args(
+    latex: str,
+    template: str = "",
+    additional_preamble: str = "",
+    short_tex: str = "",
+    show_message_during_execution: bool = True,
+) -> tuple[str, str, str]:
+    """
+    Returns the arguments latex_to_svg passes to full_tex_to_svg, which
+    also determine where on disk the result is cached
+    """
+    if show_message_during_execution:
+        message = f"Writing {(short_tex or latex)[:70]}..."
+    else:
+        message = ""
+
+    compiler, preamble = get_compiler_and_preamble(template, additional_preamble)
+    full_tex = get_full_tex(latex, preamble)
+    return full_tex, compiler, message
+
+
 @lru_cache(maxsize=128)
 def latex_to_svg(
     latex: str,
@@ -69,16 +110,9 @@ def latex_to_svg(
         LatexError: If LaTeX compilation fails
         NotImplementedError: If compiler is not supported
     """
-    if show_message_during_execution:
-        message = f"Writing {(short_tex or latex)[:70]}..."
-    else:
-        message = ""
-
-    compiler, preamble = get_tex_config(template)
-
-    preamble = "\n".join([preamble, additional_preamble])
-    full_tex = get_full_tex(latex, preamble)
-    return full_tex_to_svg(full_tex, compiler, message)
+    return full_tex_to_svg(*get_full_tex_args(
+        latex, template, additional_preamble, short_tex, show_message_during_execution
+    ))
 
 
 @cache_on_disk
@@ -86,45 +120,9 @@ def full_tex_to_svg(full_tex: str, compiler: str = "latex", message: str = ""):
     if message:
         print(message, end="\r")
 
-    if compiler == "latex":
-        dvi_ext = ".dvi"
-    elif compiler == "xelatex":
-        dvi_ext = ".xdv"
-    else:
-        raise NotImplementedError(f"Compiler '{compiler}' is not implemented")
-
     # Write intermediate files to a temporary directory
     with tempfile.TemporaryDirectory() as temp_dir:
-        tex_path = Path(temp_dir, "working").with_suffix(".tex")
-        dvi_path = tex_path.with_suffix(dvi_ext)
-
-        # Write tex file
-        tex_path.write_text(full_tex)
-
-        # Run latex compiler
-        process = subprocess.run(
-            [
-                compiler,
-                *(['-no-pdf'] if compiler == "xelatex" else []),
-                "-interaction=batchmode",
-                "-halt-on-error",
-                f"-output-directory={temp_dir}",
-                tex_path
-            ],
-            capture_output=True,
-            text=True
-        )
-
-        if process.returncode != 0:
-            # Handle error
-            error_str = ""
-            log_path = tex_path.with_suffix(".log")
-            if log_path.exists():
-                content = log_path.read_text()
-                error_match = re.search(r"(?<=\n! ).*\n.*\n", content)
-                if error_match:
-                    error_str = error_match.group()
-            raise LatexError(error_str or "LaTeX compilation failed")
+        dvi_path = compile_full_tex(full_tex, compiler, temp_dir)
 
         # Run dvisvgm and capture output directly
         process = subprocess.run(
@@ -147,5 +145,191 @@ def full_tex_to_svg(full_tex: str, compiler: str = "latex", message: str = ""):
     return result
 
 
+def compile_full_tex(full_tex: str, compiler: str, temp_dir: str) -> Path:
+    """
+    Compiles full_tex within temp_dir, returning the path of the
+    resulting dvi (or xdv) file
+    """
+    if compiler == "latex":
+        dvi_ext = ".dvi"
+    elif compiler == "xelatex":
+        dvi_ext = ".xdv"
+    else:
+        raise NotImplementedError(f"Compiler '{compiler}' is not implemented")
+
+    tex_path = Path(temp_dir, "working").with_suffix(".tex")
+    dvi_path = tex_path.with_suffix(dvi_ext)
+
+    # Write tex file
+    tex_path.write_text(full_tex)
+
+    # Run latex compiler
+    process = subprocess.run(
+        [
+            compiler,
+            *(['-no-pdf'] if compiler == "xelatex" else []),
+            "-interaction=batchmode",
+            "-halt-on-error",
+            f"-output-directory={temp_dir}",
+            tex_path
+        ],
+        capture_output=True,
+        text=True
+    )
+
+    if process.returncode != 0:
+        # Handle error
+        error_str = ""
+        log_path = tex_path.with_suffix(".log")
+        if log_path.exists():
+            content = log_path.read_text()
+            error_match = re.search(r"(?<=\n! ).*\n.*\n", content)
+            if error_match:
+                error_str = error_match.group()
+        raise LatexError(error_str or "LaTeX compilation failed")
+
+    return dvi_path
+
+
+# Batched compilation
+
+def get_full_tex_pages(contents: Sequence[str], preamble: str = ""):
+    """
+    Like get_full_tex, but with each of contents cropped to a page of its own
+    """
+    return "\n\n".join((
+        "\\documentclass[preview, multi]{standalone}",
+        preamble,
+        "\\begin{document}",
+        *(
+            "\\begin{standalone}\n" + content + "\n\\end{standalone}"
+            for content in contents
+        ),
+        "\\end{document}"
+    )) + "\n"
+
+
+def tex_pages_to_svgs(contents: Sequence[str], preamble: str, compiler: str) -> list[str]:
+    """
+    Compiles contents as the pages of a single document, with one run each
+    of the LaTeX compiler and dvisvgm, returning the svg for each page
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        dvi_path = compile_full_tex(get_full_tex_pages(contents, preamble), compiler, temp_dir)
+        subprocess.run(
+            [
+                "dvisvgm",
+                dvi_path,
+                "-n",  # no fonts
+                "-v", "0",  # quiet
+                "--page=1-",  # all pages, each to its own file
+                f"--output={Path(temp_dir, 'page-%p.svg')}",
+            ],
+            capture_output=True
+        )
+        # Sort by page number, however dvisvgm chooses to pad it
+        page_paths = sorted(
+            Path(temp_dir).glob("page-*.svg"),
+            key=lambda path: int(path.stem.split("-")[-1])
+        )
+        result = [path.read_text(encoding="utf-8") for path in page_paths]
+
+    if len(result) != len(contents):
+        raise LatexError(f"Expected {len(contents)} pages of svg, but found {len(result)}")
+    return result
+
+
+def compile_tex_pages_to_cache(
+    content_to_keys: dict[str, list[str]],
+    preamble: str,
+    compiler: str
+) -> None:
+    """
+    Compiles each content together, storing its svg under each of its cache
+    keys.  Should that fail, each is compiled on its own, so that the rest
+    are still cached, and the error of the first offending string is raised,
+    as latex_to_svg would raise it.
+    """
+    contents = list(content_to_keys)
+    if len(contents) > 1:
+        try:
+            svgs = tex_pages_to_svgs(contents, preamble, compiler)
+        except LatexError:
+            log.debug("Batched LaTeX compilation failed, compiling strings one by one")
+        else:
+            for content, svg in zip(contents, svgs):
+                for key in content_to_keys[content]:
+                    set_cached_value(key, svg)
+            return
+
+    errors = []
+    for content in contents:
+        try:
+            svg = full_tex_to_svg.__wrapped__(get_full_tex(content, preamble), compiler)
+        except LatexError as error:
+            errors.append(error)
+            continue
+        for key in content_to_keys[content]:
+            set_cached_value(key, svg)
+    if errors:
+        raise errors[0]
+
+
+def get_num_compilation_workers() -> int:
+    return manim_config.tex.num_compilation_workers or os.cpu_count() or 1
+
+
+def compile_latex_batch(items: Iterable[tuple[str, str, str, str]]) -> None:
+    """
+    Compiles each item, a tuple of latex, template, additional_preamble and
+    short_tex as they would be passed to latex_to_svg, into the
+    same disk cache latex_to_svg reads from, skipping those already there.
+
+    Items sharing a compiler and preamble are compiled together, as the
+    pages of one document, so that process startup and font loading are
+    paid once per document rather than once per string.  Documents of
+    different groups are compiled concurrently, and groups large enough
+    are split into as many documents as there are compilation workers, of
+    at least MIN_STRINGS_PER_DOCUMENT strings each.  Threads suffice for
+    this, since the work happens in the latex and dvisvgm subprocesses.
+    """
+    # Maps (compiler, preamble) to a map from content to the cache keys
+    # its svg should be stored under
+    groups: dict[tuple[str, str], dict[str, list[str]]] = dict()
+    for item in items:
+        key = get_cache_key(full_tex_to_svg, *get_full_tex_args(*item))
+        if get_cached_value(key) is not None:
+            continue
+        latex, template, additional_preamble, short_tex = item
+        group = groups.setdefault(get_compiler_and_preamble(template, additional_preamble), dict())
+        group.setdefault(latex, []).append(key)
+    if not groups:
+        return
+
+    n_workers = get_num_compilation_workers()
+    jobs = []
+    for (compiler, preamble), content_to_keys in groups.items():
+        contents = list(content_to_keys)
+        chunk_size = max(math.ceil(len(contents) / n_workers), MIN_STRINGS_PER_DOCUMENT)
+        for start in range(0, len(contents), chunk_size):
+            chunk = {content: content_to_keys[content] for content in contents[start:start + chunk_size]}
+            jobs.append((chunk, preamble, compiler))
+
+    n_strings = sum(map(len, groups.values()))
+    message = f"Writing {n_strings} LaTeX strings..."
+    print(message, end="\r")
+    try:
+        if len(jobs) == 1:
+            compile_tex_pages_to_cache(*jobs[0])
+        else:
+            with ThreadPoolExecutor(min(n_workers, len(jobs))) as executor:
+                futures = [executor.submit(compile_tex_pages_to_cache, *job) for job in jobs]
+                # Raises the first error, once all others have finished
+                for future in futures:
+                    future.result()
+    finally:
+        print(" " * len(message), end="\r")
+
+
 class LatexError(Exception):
     pass